@@ -1,18 +1,16 @@
 """Command-line interface for the MongoDB LLM CLI."""
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Tuple
 
 import click
 
-from mongo_llm_cli import llm_orchestrator
 from mongo_llm_cli.config import get_config
 from mongo_llm_cli.confirmation import confirmation
-from mongo_llm_cli.executor import execute
 from mongo_llm_cli.formatter import print as format_print
-from mongo_llm_cli.mongodb_tool import MongoDBTool
+from mongo_llm_cli.pool import get_tool
 from mongo_llm_cli.query_translator import translate
-from mongo_llm_cli.schema_inspector import inspect_schema
 
 
 @click.group()
@@ -22,14 +20,33 @@ from mongo_llm_cli.schema_inspector import inspect_schema
     help="Path to a configuration file",
     type=click.Path(exists=True, dir_okay=False),
 )
+@click.option(
+    "--limit-output",
+    help="Maximum number of result items to print",
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--yes",
+    "-y",
+    "assume_yes",
+    is_flag=True,
+    help="Run destructive operations without asking for confirmation",
+)
 @click.pass_context
-def mongo_llm(ctx: click.Context, config: Optional[str] = None) -> None:
+def mongo_llm(
+    ctx: click.Context,
+    config: Optional[str] = None,
+    limit_output: Optional[int] = None,
+    assume_yes: bool = False,
+) -> None:
     """MongoDB Natural Language CLI tool.
 
     This tool allows you to interact with MongoDB using natural language queries.
     """
     ctx.ensure_object(dict)
     ctx.obj["config_path"] = config
+    ctx.obj["limit_output"] = limit_output
+    ctx.obj["assume_yes"] = assume_yes
 
 
 @mongo_llm.command()
@@ -38,7 +55,7 @@ def test_connection(ctx: click.Context) -> None:
     """Test the MongoDB connection."""
     try:
         config = get_config(ctx.obj.get("config_path"))
-        tool = MongoDBTool(config.mongo_uri, config.mongo_db_name)
+        tool = get_tool(config.mongo_uri, config.mongo_db_name)
         
         # Try to list collections to verify connection works
         collections = tool.list_collections()
@@ -56,8 +73,13 @@ def test_connection(ctx: click.Context) -> None:
 
 @mongo_llm.command()
 @click.argument("nl_query", nargs=-1)
+@click.option(
+    "--refresh-schema",
+    is_flag=True,
+    help="Ignore the cached database schema and inspect the database again",
+)
 @click.pass_context
-def run(ctx: click.Context, nl_query: Tuple[str, ...]) -> None:
+def run(ctx: click.Context, nl_query: Tuple[str, ...], refresh_schema: bool) -> None:
     """Run a natural language query against MongoDB."""
     if not nl_query:
         click.echo(click.style("Error: No query provided.", fg="red"))
@@ -65,17 +87,30 @@ def run(ctx: click.Context, nl_query: Tuple[str, ...]) -> None:
         sys.exit(1)
         
     query = " ".join(nl_query)
-    
+
+    # Imported here so that --help and test-connection don't pay for them
+    from mongo_llm_cli import llm_orchestrator
+    from mongo_llm_cli.executor import execute
+    from mongo_llm_cli.schema_inspector import inspect_schema
+
     try:
         # Get configuration
         config = get_config(ctx.obj.get("config_path"))
         
         # Initialize MongoDB tool
-        tool = MongoDBTool(config.mongo_uri, config.mongo_db_name)
+        tool = get_tool(config.mongo_uri, config.mongo_db_name)
         
-        # Inspect database schema
+        # Inspect database schema, preparing the LLM client in the background
+        # so its setup overlaps with the database round trips
         click.echo("Inspecting database schema...")
-        schema = inspect_schema(tool)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            model_ready = executor.submit(
+                llm_orchestrator.get_model, config.gemini_api_key
+            )
+            schema = inspect_schema(
+                tool, ttl=config.schema_cache_ttl, refresh=refresh_schema
+            )
+            model_ready.result()
         
         # Call LLM
         click.echo("Processing your query...")
@@ -86,11 +121,13 @@ def run(ctx: click.Context, nl_query: Tuple[str, ...]) -> None:
         
         # Execute with confirmation for destructive operations
         click.echo(f"Executing: {parsed.tool}")
-        with confirmation(parsed.tool, parsed.args):
+        with confirmation(
+            parsed.tool, parsed.args, assume_yes=ctx.obj.get("assume_yes", False)
+        ):
             result = execute(tool, parsed)
             
         # Format and print the result
-        format_print(result)
+        format_print(result, limit=ctx.obj.get("limit_output"))
         
     except Exception as e:
         click.echo(click.style(f"Error: {str(e)}", fg="red"))
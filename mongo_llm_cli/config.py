@@ -1,5 +1,6 @@
 """Configuration management for the MongoDB LLM CLI."""
 
+import functools
 import os
 from dataclasses import dataclass
 from pathlib import Path
@@ -7,20 +8,28 @@ from typing import Optional
 
 from dotenv import load_dotenv
 
+# Default number of seconds an inspected schema stays valid in the on-disk cache
+DEFAULT_SCHEMA_CACHE_TTL = 300
 
-@dataclass
+
+@dataclass(frozen=True)
 class Config:
     """Configuration for the MongoDB LLM CLI."""
 
     mongo_uri: str
     mongo_db_name: str
     gemini_api_key: str
+    schema_cache_ttl: int = DEFAULT_SCHEMA_CACHE_TTL
 
 
+@functools.lru_cache(maxsize=8)
 def get_config(config_path: Optional[str] = None) -> Config:
     """
     Load configuration from environment variables or .env file.
 
+    The result is cached per ``config_path`` for the lifetime of the process;
+    call ``get_config.cache_clear()`` to force the configuration to be reloaded.
+
     Args:
         config_path: Optional path to a .env file. If not provided,
                     the default .env file in the current directory is used.
@@ -61,8 +70,19 @@ def get_config(config_path: Optional[str] = None) -> Config:
             f"Please set these in your environment or .env file."
         )
 
+    # Optional configuration values
+    schema_cache_ttl = os.getenv("SCHEMA_CACHE_TTL", str(DEFAULT_SCHEMA_CACHE_TTL))
+    try:
+        schema_cache_ttl = int(schema_cache_ttl)
+    except ValueError:
+        raise ValueError(
+            f"Invalid SCHEMA_CACHE_TTL: {schema_cache_ttl!r}. "
+            "Expected a number of seconds."
+        )
+
     return Config(
         mongo_uri=mongo_uri,
         mongo_db_name=mongo_db_name,
         gemini_api_key=gemini_api_key,
+        schema_cache_ttl=schema_cache_ttl,
     ) 
\ No newline at end of file
@@ -2,26 +2,40 @@
 
 import sys
 from contextlib import contextmanager
-from typing import Any, Dict, Iterator, Set
+from typing import Any, Dict, FrozenSet, Iterator
 
 import click
 
 # Set of destructive operation names that require confirmation
-DESTRUCTIVE_OPERATIONS: Set[str] = {
-    "drop_collection", 
-    "drop_index", 
+DESTRUCTIVE_OPERATIONS: FrozenSet[str] = frozenset({
+    "drop_collection",
+    "drop_index",
     "delete_documents"
+})
+
+# bulk_write operation types that delete documents
+_BULK_DELETE_TYPES: FrozenSet[str] = frozenset({"delete", "delete_many"})
+
+# User-friendly descriptions of what each destructive operation does
+_DESCRIPTIONS: Dict[str, str] = {
+    "drop_collection": "permanently delete a collection and all its documents",
+    "drop_index": "remove an index from a collection",
+    "delete_documents": "permanently delete multiple documents",
+    "bulk_write": "permanently delete documents as part of a bulk write",
 }
 
 
 @contextmanager
-def confirmation(tool_name: str, args: Dict[str, Any]) -> Iterator[None]:
+def confirmation(
+    tool_name: str, args: Dict[str, Any], assume_yes: bool = False
+) -> Iterator[None]:
     """
     Context manager that prompts for confirmation before executing destructive operations.
 
     Args:
         tool_name: The name of the tool being called.
         args: The arguments being passed to the tool.
+        assume_yes: If True, skip the prompt and only report the operation.
 
     Yields:
         None: Context manager yields nothing.
@@ -29,17 +43,22 @@ def confirmation(tool_name: str, args: Dict[str, Any]) -> Iterator[None]:
     Raises:
         click.Abort: If the user doesn't confirm a destructive operation.
     """
-    if tool_name in DESTRUCTIVE_OPERATIONS:
+    if _is_destructive(tool_name, args):
         # Format the operation for display
         op_description = f"{tool_name}"
         if "collection" in args:
             op_description += f" on collection '{args['collection']}'"
         
         # Format the args for display
-        args_str = ", ".join([f"{k}={v}" for k, v in args.items() if k != "collection"])
+        args_str = ", ".join(f"{k}={v}" for k, v in args.items() if k != "collection")
         if args_str:
             op_description += f" with {args_str}"
-        
+
+        if assume_yes:
+            click.echo(f"Confirmed by --yes: {op_description}")
+            yield
+            return
+
         # Prompt for confirmation
         confirmed = click.confirm(
             f"This operation will {_get_operation_description(tool_name)}. "
@@ -54,12 +73,20 @@ def confirmation(tool_name: str, args: Dict[str, Any]) -> Iterator[None]:
     yield
 
 
+def _is_destructive(tool_name: str, args: Dict[str, Any]) -> bool:
+    """Check whether a tool call can delete data and needs confirmation."""
+    if tool_name in DESTRUCTIVE_OPERATIONS:
+        return True
+    if tool_name == "bulk_write":
+        operations = args.get("operations")
+        if isinstance(operations, list):
+            return any(
+                isinstance(op, dict) and op.get("type") in _BULK_DELETE_TYPES
+                for op in operations
+            )
+    return False
+
+
 def _get_operation_description(tool_name: str) -> str:
     """Get a user-friendly description of the operation."""
-    descriptions = {
-        "drop_collection": "permanently delete a collection and all its documents",
-        "drop_index": "remove an index from a collection",
-        "delete_documents": "permanently delete multiple documents"
-    }
-    
-    return descriptions.get(tool_name, "perform a destructive operation") 
\ No newline at end of file
+    return _DESCRIPTIONS.get(tool_name, "perform a destructive operation") 
\ No newline at end of file
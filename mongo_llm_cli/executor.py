@@ -1,9 +1,24 @@
 """Executor for MongoDB tool calls."""
 
-from typing import Any, Dict, Optional
+import inspect
+import itertools
+from typing import Any, Callable, Dict, Iterator, Optional
 
 from mongo_llm_cli.mongodb_tool import MongoDBTool
 from mongo_llm_cli.query_translator import ParsedQuery
+from mongo_llm_cli.schema_inspector import clear_schema_cache
+
+# Public MongoDBTool methods callable by the LLM, keyed by name
+_DISPATCH: Dict[str, Callable[..., Any]] = {
+    name: fn
+    for name, fn in inspect.getmembers(MongoDBTool, predicate=inspect.isfunction)
+    if not name.startswith("_")
+}
+
+# Tools that change the collection list and so invalidate the cached schema
+_SCHEMA_CHANGING_TOOLS = frozenset(
+    {"create_collection", "drop_collection", "rename_collection"}
+)
 
 
 def execute(tool: MongoDBTool, parsed_query: ParsedQuery) -> Dict[str, Any]:
@@ -23,8 +38,8 @@ def execute(tool: MongoDBTool, parsed_query: ParsedQuery) -> Dict[str, Any]:
     try:
         # Get the method to call
         method_name = parsed_query.tool
-        method = getattr(tool, method_name, None)
-        
+        method = _DISPATCH.get(method_name)
+
         if method is None:
             return {
                 "success": False,
@@ -33,7 +48,16 @@ def execute(tool: MongoDBTool, parsed_query: ParsedQuery) -> Dict[str, Any]:
             }
         
         # Call the method with the provided arguments
-        result = method(**parsed_query.args)
+        result = method(tool, **parsed_query.args)
+
+        # Streaming results (e.g. iter_find) only reach the server when first
+        # iterated; fetch the first item here so query errors are reported
+        # as failures instead of surfacing while the results are printed
+        if isinstance(result, Iterator):
+            result = _prime(result)
+
+        if method_name in _SCHEMA_CHANGING_TOOLS:
+            clear_schema_cache(tool)
         
         return {
             "success": True,
@@ -45,4 +69,11 @@ def execute(tool: MongoDBTool, parsed_query: ParsedQuery) -> Dict[str, Any]:
             "success": False,
             "error": str(e),
             "data": None,
-        } 
\ No newline at end of file
+        }
+
+
+def _prime(items: Iterator) -> Iterator:
+    """Fetch the first item of an iterator and return an equivalent iterator."""
+    for first in items:
+        return itertools.chain((first,), items)
+    return iter(())
@@ -1,15 +1,22 @@
 """Formatter for pretty-printing MongoDB CLI results."""
 
+import itertools
 import json
-from json import JSONEncoder
-from typing import Any, Dict, List, Union
+from typing import Any, Dict, Iterator, List, Optional, Union
 from datetime import datetime
 from bson.objectid import ObjectId
 
 import click
+import orjson
 
+# orjson options used for pretty-printed output
+_ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
 
-def print(result: Dict[str, Any]) -> None:
+# Lists of documents longer than this are streamed through a pager
+PAGER_THRESHOLD = 10_000
+
+
+def print(result: Dict[str, Any], limit: Optional[int] = None) -> None:
     """
     Print the result of a MongoDB operation.
 
@@ -18,6 +25,7 @@ def print(result: Dict[str, Any]) -> None:
             - success: Boolean indicating success or failure
             - data: Result data (if successful)
             - error: Error message (if unsuccessful)
+        limit: Optional maximum number of list items to print.
     """
     if not result["success"]:
         print_error(result["error"])
@@ -31,14 +39,16 @@ def print(result: Dict[str, Any]) -> None:
     data_type = type(data)
 
     if isinstance(data, list):
-        print_list(data)
+        print_list(data, limit)
+    elif isinstance(data, Iterator):
+        print_iter(data, limit)
     elif isinstance(data, dict):
         print_dict(data)
     elif isinstance(data, str):
         if data.startswith(("{", "[")):  # Detect if it might be JSON string
             try:
                 json_data = json.loads(data)
-                print_dict(json_data) if isinstance(json_data, dict) else print_list(json_data)
+                print_dict(json_data) if isinstance(json_data, dict) else print_list(json_data, limit)
             except json.JSONDecodeError:
                 click.echo(data)
         else:
@@ -56,31 +66,70 @@ def print_error(error: str) -> None:
     click.echo(click.style(f"Error: {error}", fg="red", bold=True))
 
 
-def print_list(items: List) -> None:
-    """Print a list of items."""
+def print_list(items: List, limit: Optional[int] = None) -> None:
+    """
+    Print a list of items.
+
+    Args:
+        items: The items to print.
+        limit: Optional maximum number of items to print; the number of
+               items left out is reported after the output.
+    """
     if not items:
         click.echo("No items found.")
         return
 
-    # Check if list contains dictionaries or other complex objects
-    if all(isinstance(item, (dict, list)) for item in items):
-        # Print full JSON for lists of dictionaries or lists
-        formatted_json = json.dumps(items, indent=2, cls=DateTimeEncoder)
-        click.echo(formatted_json)
+    total = len(items)
+    if limit is not None and total > limit:
+        items = items[:limit]
+
+    # Check if list contains dictionaries or other complex objects. MongoDB
+    # results are homogeneous in practice, so the first item decides the
+    # format instead of scanning the whole list
+    if isinstance(items[0], (dict, list)):
+        if len(items) > PAGER_THRESHOLD:
+            # Serialize one item at a time as the pager consumes the output
+            # instead of rendering the whole result set up front
+            click.echo_via_pager(_stream_json(items))
+        else:
+            # Print full JSON for lists of dictionaries or lists
+            click.echo(_dumps(items))
+    elif all(isinstance(item, (str, int, float)) for item in items):
+        # Fast path for lists of scalars such as collection names, which
+        # need no per-item formatting. Every item is checked so documents
+        # mixed into a scalar list (e.g. from distinct) are still printed
+        # as JSON
+        click.echo("\n".join(f"{i}. {item}" for i, item in enumerate(items, 1)))
     else:
-        # Print simple list
-        for i, item in enumerate(items, 1):
-            click.echo(f"{i}. {_format_item(item)}")
+        # Print simple list, building all lines first and writing them at once
+        # rather than issuing one write per item
+        click.echo("\n".join(
+            f"{i}. {_format_item(item)}" for i, item in enumerate(items, 1)
+        ))
+
+    if len(items) < total:
+        click.echo(
+            f"... {total - len(items)} more items not shown "
+            f"(use --limit-output to change)"
+        )
+
+
+def print_iter(items: Iterator, limit: Optional[int] = None) -> None:
+    """
+    Print items from an iterator as they arrive, one JSON document per line.
+
+    Args:
+        items: Iterator of items, such as documents streamed from a cursor.
+        limit: Optional maximum number of items to print.
+    """
+    count = 0
+    for item in itertools.islice(items, limit):
+        click.echo(_dumps_line(item))
+        count += 1
 
+    if not count:
+        click.echo("No items found.")
 
-class DateTimeEncoder(JSONEncoder):
-    """Custom JSONEncoder to handle datetime and ObjectId objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, ObjectId):
-            return str(obj)
-        return super().default(obj)
 
 def print_dict(data: Dict) -> None:
     """Print a dictionary as JSON."""
@@ -88,8 +137,42 @@ def print_dict(data: Dict) -> None:
         click.echo("Empty result.")
         return
 
-    formatted_json = json.dumps(data, indent=2, cls=DateTimeEncoder)
-    click.echo(formatted_json)
+    click.echo(_dumps(data))
+
+
+def to_json(obj: Any) -> str:
+    """Serialize an object, including datetime and ObjectId values, to indented JSON."""
+    return _dumps(obj).decode()
+
+
+def _dumps(obj: Any) -> bytes:
+    """
+    Serialize an object to indented JSON bytes.
+
+    The bytes are handed straight to click.echo, which writes them to the
+    binary stdout stream without building an intermediate str.
+    """
+    return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS)
+
+
+def _stream_json(items: List) -> Iterator[str]:
+    """Yield each item as a line of compact JSON."""
+    separator = ""
+    for item in items:
+        yield separator + _dumps_line(item)
+        separator = "\n"
+
+
+def _dumps_line(obj: Any) -> str:
+    """Serialize an object to compact, single-line JSON."""
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
+def _default(obj: Any) -> Any:
+    """Serialize types orjson does not handle natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
 
 def _format_item(item: Any) -> str:
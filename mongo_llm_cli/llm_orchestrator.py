@@ -1,22 +1,33 @@
 """Orchestrator for communicating with LLM APIs."""
 
+import functools
 import inspect
 import json
-from typing import Any, Dict, List
+import re
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
-import google.generativeai as genai
+from mongo_llm_cli.formatter import to_json
 
-from mongo_llm_cli.mongodb_tool import MongoDBTool
-from mongo_llm_cli.formatter import DateTimeEncoder
+if TYPE_CHECKING:
+    import google.generativeai as genai
 
+# Matches a markdown code block (optionally tagged as json) around the response
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)```", re.S)
 
+
+@functools.lru_cache(maxsize=1)
 def build_tool_schema() -> Dict[str, Any]:
     """
     Build a JSON schema for the MongoDBTool methods.
 
+    The schema is a pure function of the MongoDBTool class, so it is built
+    once per process and the same object is returned on subsequent calls.
+
     Returns:
         Dict[str, Any]: Schema describing tool methods, their parameters, and return types.
     """
+    from mongo_llm_cli.mongodb_tool import MongoDBTool
+
     tool_schema = {"methods": []}
     
     # Collect methods from MongoDBTool
@@ -62,6 +73,44 @@ def build_tool_schema() -> Dict[str, Any]:
     return tool_schema
 
 
+@functools.lru_cache(maxsize=1)
+def _tool_schema_json() -> str:
+    """Return the cached, pretty-printed JSON rendering of build_tool_schema()."""
+    return json.dumps(build_tool_schema(), indent=2)
+
+
+# Static instructions that follow the user query in every prompt
+_PROMPT_SUFFIX = """
+
+Return a JSON object: { "tool": <tool_name>, "args": { ... } }
+
+Important:
+1. Only select from the available tools. Don't invent new ones.
+2. Make sure all required parameters for the chosen tool are provided.
+3. For destructive operations (drop, delete), be absolutely certain this is what
+   the user wants.
+4. Return only valid JSON without any explanations or additional text.
+5. When the user only asks about certain fields and the tool is find_documents,
+   find_one_document, iter_find or aggregate_documents, pass a "projection" that
+   includes just those fields. Other tools have no "projection" parameter.
+"""
+
+
+def _render_prompt_prefix(tool_schema_json: str) -> str:
+    """Render the part of the prompt that precedes the database schema."""
+    return (
+        "You are a database assistant. Given:\n"
+        f"  • Available tools: {tool_schema_json}\n"
+        "  • Database schema context: "
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _prompt_prefix() -> str:
+    """Return the cached prompt prefix for the default tool schema."""
+    return _render_prompt_prefix(_tool_schema_json())
+
+
 def construct_prompt(query: str, schema: Dict[str, Any], tool_schema: Dict[str, Any]) -> str:
     """
     Construct a prompt for the LLM with the user's query and context.
@@ -74,20 +123,36 @@ def construct_prompt(query: str, schema: Dict[str, Any], tool_schema: Dict[str,
     Returns:
         str: A prompt for the LLM.
     """
-    prompt = f"""You are a database assistant. Given:
-  • Available tools: {json.dumps(tool_schema, indent=2)}
-  • Database schema context: {json.dumps(schema, indent=2, cls=DateTimeEncoder)}
-  • User query: "{query}"
+    if tool_schema is build_tool_schema():
+        prefix = _prompt_prefix()
+    else:
+        prefix = _render_prompt_prefix(json.dumps(tool_schema, indent=2))
 
-Return a JSON object: {{ "tool": <tool_name>, "args": {{ ... }} }}
+    return f'{prefix}{to_json(schema)}\n  • User query: "{query}"{_PROMPT_SUFFIX}'
 
-Important:
-1. Only select from the available tools. Don't invent new ones.
-2. Make sure all required parameters for the chosen tool are provided.
-3. For destructive operations (drop, delete), be absolutely certain this is what the user wants.
-4. Return only valid JSON without any explanations or additional text.
-"""
-    return prompt
+
+@functools.lru_cache(maxsize=4)
+def get_model(api_key: str) -> "genai.GenerativeModel":
+    """
+    Configure the Gemini API and return the model used for queries.
+
+    The model is cached per API key, and the tool schema is rendered at the
+    same time, so callers can warm both up in the background (e.g. while the
+    database schema is being inspected) before calling call_llm.
+
+    Args:
+        api_key: Google Gemini API key.
+
+    Returns:
+        genai.GenerativeModel: The configured Gemini model.
+    """
+    # Imported lazily: google.generativeai pulls in grpc and the Google auth
+    # stack, which commands that never call the LLM shouldn't pay for
+    import google.generativeai as genai
+
+    genai.configure(api_key=api_key)
+    _prompt_prefix()
+    return genai.GenerativeModel('gemini-2.0-flash-lite')
 
 
 def call_llm(query: str, schema: Dict[str, Any], api_key: str) -> Dict[str, Any]:
@@ -103,30 +168,75 @@ def call_llm(query: str, schema: Dict[str, Any], api_key: str) -> Dict[str, Any]
         Dict[str, Any]: The parsed JSON response from the LLM.
     """
     # Configure the Gemini API
-    genai.configure(api_key=api_key)
-    model = genai.GenerativeModel('gemini-2.0-flash-lite')
-    
+    model = get_model(api_key)
+
     # Build tool schema
     tool_schema = build_tool_schema()
-    print(tool_schema)
+
     # Construct prompt
     prompt = construct_prompt(query, schema, tool_schema)
     
-    # Call the LLM
-    response = model.generate_content(prompt)
-    # print("this is the response from llm ",response)
-    # Parse the response
+    # Stream the response and stop as soon as a complete JSON object arrives,
+    # instead of waiting for any trailing text the model may still emit
+    response = model.generate_content(prompt, stream=True)
+    response_text = ""
+    for chunk in response:
+        try:
+            response_text += chunk.text
+        except ValueError:
+            # Chunks without text parts (e.g. safety metadata) carry no content
+            continue
+
+        json_text = _find_json_object(response_text)
+        if json_text is not None:
+            try:
+                return json.loads(json_text)
+            except json.JSONDecodeError:
+                # Keep reading; the full response is parsed below
+                pass
+
+    # Parse the full response
     try:
-        # Extract JSON string from the response
-        response_text = response.text
         # Remove any markdown code block markers if present
-        if "```json" in response_text:
-            response_text = response_text.split("```json")[1].split("```")[0].strip()
-        elif "```" in response_text:
-            response_text = response_text.split("```")[1].split("```")[0].strip()
-            
+        match = _FENCE_RE.search(response_text)
+        json_text = match.group(1).strip() if match else response_text.strip()
+
         # Parse JSON
-        parsed_response = json.loads(response_text)
+        parsed_response = json.loads(json_text)
         return parsed_response
     except Exception as e:
-        raise ValueError(f"Failed to parse LLM response: {str(e)}\nResponse: {response.text}")
+        raise ValueError(f"Failed to parse LLM response: {str(e)}\nResponse: {response_text}")
+
+
+def _find_json_object(text: str) -> Optional[str]:
+    """
+    Return the first complete top-level JSON object in ``text``, if any.
+
+    Braces inside JSON strings are ignored, so the object is detected as soon
+    as its closing brace has been received.
+    """
+    start = text.find("{")
+    if start == -1:
+        return None
+
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+    return None
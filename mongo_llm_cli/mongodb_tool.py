@@ -1,24 +1,441 @@
 """MongoDB interaction tools."""
 
-from typing import Dict, List, Optional, Tuple, Any, Union
+import datetime
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, Any, Union
 
 import pymongo
+from bson.codec_options import TypeDecoder, TypeRegistry
+from bson.errors import InvalidId
 from bson.objectid import ObjectId
+from pymongo import (
+    DeleteMany,
+    DeleteOne,
+    InsertOne,
+    ReturnDocument,
+    UpdateMany,
+    UpdateOne,
+    WriteConcern,
+)
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, PyMongoError
+
+# Builders for bulk_write operations, keyed by operation type
+_BULK_OPERATIONS: Dict[str, Callable[[Dict], Any]] = {
+    "insert": lambda op: InsertOne(op["document"]),
+    "update": lambda op: UpdateOne(op["filter"], op["update"]),
+    "update_many": lambda op: UpdateMany(op["filter"], op["update"]),
+    "delete": lambda op: DeleteOne(op["filter"]),
+    "delete_many": lambda op: DeleteMany(op["filter"]),
+}
+
+
+class PartialInsertError(PyMongoError):
+    """Raised when some documents of an insert_many_documents batch fail."""
+
+    def __init__(
+        self, inserted_ids: List[Any], write_errors: List[Dict], total: int
+    ) -> None:
+        self.inserted_ids = inserted_ids
+        self.write_errors = write_errors
+        errors = "; ".join(
+            f"document {error['index']}: {error.get('errmsg', error.get('code'))}"
+            for error in write_errors
+        )
+        super().__init__(
+            f"Inserted {len(inserted_ids)} of {total} documents, "
+            f"{len(write_errors)} failed ({errors}). "
+            f"Inserted _ids: {[str(i) for i in inserted_ids]}"
+        )
+
+
+class _ObjectIdAsStr(TypeDecoder):
+    """Decode BSON ObjectIds to their hex string."""
+
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+
+# Type registry for reading documents. ObjectIds, including nested ones, are
+# converted while the BSON is decoded, so results are JSON-ready without a
+# second pass over every document in Python
+DOCUMENT_TYPE_REGISTRY = TypeRegistry([_ObjectIdAsStr()])
+
+# find_one_and_update return_document values, keyed by their lowercase name
+_RETURN_DOCUMENTS: Dict[str, bool] = {
+    "before": ReturnDocument.BEFORE,
+    "after": ReturnDocument.AFTER,
+}
+
+# Converters from BSON-specific types to JSON-friendly values, keyed by exact type
+_BSON_SERIALIZERS: Dict[type, Callable[[Any], Any]] = {
+    ObjectId: str,
+    datetime.datetime: datetime.datetime.isoformat,
+    bytes: bytes.hex,
+}
+
+
+def _serialize_bson_in_place(value: Any) -> Any:
+    """
+    Convert BSON-specific values in a document tree to JSON-friendly values.
+
+    Nested dicts and lists are walked with an explicit stack, so deeply nested
+    results don't hit the recursion limit, and containers are updated in place
+    instead of being rebuilt.
+    """
+    serializer = _BSON_SERIALIZERS.get(type(value))
+    if serializer is not None:
+        return serializer(value)
+
+    stack = [value] if isinstance(value, (dict, list)) else []
+    while stack:
+        container = stack.pop()
+        items = (
+            container.items() if isinstance(container, dict) else enumerate(container)
+        )
+        for key, child in items:
+            serializer = _BSON_SERIALIZERS.get(type(child))
+            if serializer is not None:
+                container[key] = serializer(child)
+            elif isinstance(child, (dict, list)):
+                stack.append(child)
+    return value
+
+
+# Upper bound on concurrent list_indexes calls in list_indexes_many
+MAX_INDEX_WORKERS = 16
+
+# Largest first batch find_documents requests from the server
+MAX_FIND_BATCH_SIZE = 1000
+
+# Seconds that collection names, indexes and statistics are cached per tool
+METADATA_CACHE_TTL = 5.0
+
+
+def _match_fields(condition: Dict) -> Optional[Set[str]]:
+    """
+    Return the top-level fields a $match condition filters on.
+
+    Returns None if the condition uses operators such as $expr or $text
+    whose field references cannot be determined.
+    """
+    fields: Set[str] = set()
+    for key, value in condition.items():
+        if key in ("$and", "$or", "$nor"):
+            for clause in value:
+                clause_fields = _match_fields(clause)
+                if clause_fields is None:
+                    return None
+                fields |= clause_fields
+        elif key.startswith("$"):
+            return None
+        else:
+            fields.add(key.split(".", 1)[0])
+    return fields
+
+
+def _stage_commutes_with_match(stage: Dict, fields: Set[str]) -> bool:
+    """Check whether a $match on ``fields`` can be moved ahead of ``stage``."""
+    if len(stage) != 1:
+        return False
+    name, spec = next(iter(stage.items()))
+    if name == "$sort":
+        return True
+    if name in ("$addFields", "$set"):
+        return not fields & {key.split(".", 1)[0] for key in spec}
+    if name == "$unset":
+        unset = [spec] if isinstance(spec, str) else spec
+        return not fields & {key.split(".", 1)[0] for key in unset}
+    return False
+
+
+def _hoist_matches(pipeline: List[Dict]) -> List[Dict]:
+    """
+    Move $match stages ahead of preceding stages they commute with.
+
+    A $match only moves past $sort stages and past $addFields, $set and
+    $unset stages that don't touch the fields it filters on, so results
+    are unchanged. $match stages keep their relative order.
+    """
+    result: List[Dict] = []
+    for stage in pipeline:
+        condition = stage.get("$match") if len(stage) == 1 else None
+        fields = _match_fields(condition) if isinstance(condition, dict) else None
+        position = len(result)
+        if fields is not None:
+            while position and _stage_commutes_with_match(result[position - 1], fields):
+                position -= 1
+        result.insert(position, stage)
+    return result
+
+
+# Collection statistics reported by describe_database
+_DESCRIBE_STAT_FIELDS = ("count", "size", "avgObjSize", "storageSize", "totalIndexSize")
+
+
+def _describe_pipeline(collections: List[str]) -> List[Dict]:
+    """
+    Build one aggregation returning the indexes and statistics of ``collections``.
+
+    Each output document is tagged with its source collection and holds
+    either an ``index`` or a ``stats`` entry.
+    """
+
+    def describe_stages(name: str) -> List[Dict]:
+        stats_stages = [
+            {"$collStats": {"storageStats": {}}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "collection": {"$literal": name},
+                    "stats": {
+                        field: f"$storageStats.{field}"
+                        for field in _DESCRIBE_STAT_FIELDS
+                    },
+                }
+            },
+        ]
+        return [
+            {"$indexStats": {}},
+            {
+                "$project": {
+                    "_id": 0,
+                    "collection": {"$literal": name},
+                    "index": {"name": "$name", "key": "$key"},
+                }
+            },
+            {"$unionWith": {"coll": name, "pipeline": stats_stages}},
+        ]
+
+    first, *rest = collections
+    return describe_stages(first) + [
+        {"$unionWith": {"coll": name, "pipeline": describe_stages(name)}}
+        for name in rest
+    ]
+
+
+def _merge_shard_stats(shards: List[Dict]) -> Dict:
+    """Combine the per-shard storage statistics of one collection."""
+    if len(shards) == 1:
+        return shards[0]
+    merged = {
+        field: sum(stats.get(field) or 0 for stats in shards)
+        for field in _DESCRIBE_STAT_FIELDS
+    }
+    merged["avgObjSize"] = merged["size"] / merged["count"] if merged["count"] else 0
+    return merged
+
+
+def _flatten_once(values: Any) -> Dict:
+    """Build an expression that replaces each array in ``values`` by its items."""
+    return {
+        "$reduce": {
+            "input": values,
+            "initialValue": [],
+            "in": {
+                "$concatArrays": [
+                    "$$value",
+                    {"$cond": [{"$isArray": "$$this"}, "$$this", ["$$this"]]},
+                ]
+            },
+        }
+    }
+
+
+def _distinct_expression(field: str) -> Dict:
+    """
+    Build an expression listing the values the distinct command reports.
+
+    The path is walked one segment at a time from the document root. At each
+    step arrays are traversed into their subdocuments, and subdocuments
+    missing the next segment are dropped, so missing fields contribute
+    nothing while explicit nulls are kept. Arrays found at the end of the
+    path contribute their items. Positional segments such as ``a.0`` are
+    treated as field names.
+    """
+    values: Any = ["$$ROOT"]
+    for segment in field.split("."):
+        values = {
+            "$map": {
+                "input": {
+                    "$filter": {
+                        "input": _flatten_once(values),
+                        "cond": {
+                            "$and": [
+                                {"$eq": [{"$type": "$$this"}, "object"]},
+                                {"$ne": [{"$type": f"$$this.{segment}"}, "missing"]},
+                            ]
+                        },
+                    }
+                },
+                "in": f"$$this.{segment}",
+            }
+        }
+    return _flatten_once(values)
+
+
+# Strings that ObjectId() accepts, checked up front so invalid IDs don't
+# cost a raised and discarded InvalidId
+_OBJECT_ID_RE = re.compile(r"\A[0-9a-fA-F]{24}\Z")
+
+
+def _convert_object_ids(ids: List[Any]) -> List[Any]:
+    """
+    Convert the strings in an ``$in`` list to ObjectIds.
+
+    Lists of ID strings are converted with a single ``map`` over the
+    ObjectId constructor; mixed lists, or lists with strings that are not
+    valid ObjectIds, fall back to a per-element check that leaves those
+    values unchanged.
+
+    IDs are decoded with ``bytes.fromhex``, which is faster than passing the
+    string to ObjectId. fromhex skips whitespace, so the fast path first
+    requires every string to be exactly 24 characters long.
+    """
+    if ids and type(ids[0]) is str:
+        try:
+            if all(len(s) == 24 for s in ids):
+                return list(map(ObjectId, map(bytes.fromhex, ids)))
+        except (TypeError, ValueError, InvalidId):
+            pass
+    return list(map(_coerce_object_id, ids))
+
+
+def _coerce_object_id(
+    value: Any, _match=_OBJECT_ID_RE.match, _ObjectId=ObjectId, _fromhex=bytes.fromhex
+) -> Any:
+    """Convert ``value`` to an ObjectId if it is a valid ObjectId string."""
+    # Defaults bind the regex and constructors as locals for the per-element map
+    return _ObjectId(_fromhex(value)) if type(value) is str and _match(value) else value
+
+
+# MongoClient instances shared by MongoDBTool objects, keyed by URI and options
+_CLIENT_CACHE: Dict[Tuple[str, Tuple[Tuple[str, Any], ...]], pymongo.MongoClient] = {}
+_CLIENT_CACHE_LOCK = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Convert dicts, lists and sets in a client option value to hashable values."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(v) for v in value)
+    return value
+
+
+def _get_client(uri: str, **client_options: Any) -> pymongo.MongoClient:
+    """Return the shared MongoClient for a URI and options, creating it if needed."""
+    key = (uri, _freeze(client_options))
+    try:
+        hash(key)
+    except TypeError:
+        # Options that can't be compared (e.g. unhashable custom objects) get
+        # a client of their own instead of a shared one
+        return pymongo.MongoClient(uri, **client_options)
+
+    with _CLIENT_CACHE_LOCK:
+        client = _CLIENT_CACHE.get(key)
+        if client is None:
+            client = pymongo.MongoClient(uri, **client_options)
+            _CLIENT_CACHE[key] = client
+        return client
+
+
+def close_shared_clients() -> None:
+    """
+    Close and forget all shared MongoClient instances.
+
+    Tools cached by pool.get_tool hold these clients, so that cache is
+    cleared too; later get_tool calls build tools with fresh clients.
+    """
+    # Imported here because pool imports this module
+    from mongo_llm_cli.pool import get_tool
+
+    get_tool.cache_clear()
+    with _CLIENT_CACHE_LOCK:
+        clients = list(_CLIENT_CACHE.values())
+        _CLIENT_CACHE.clear()
+    for client in clients:
+        client.close()
 
 
 class MongoDBTool:
     """Tool for interacting with MongoDB databases."""
 
-    def __init__(self, uri: str, db_name: str):
+    def __init__(self, uri: str, db_name: str, **client_options: Any):
         """
         Initialize the MongoDB tool.
 
         Args:
             uri: MongoDB connection URI.
             db_name: Name of the database to use.
+            **client_options: Additional MongoClient options such as
+                              connection pool settings (e.g. maxPoolSize=50).
+
+        Tools created with the same URI and options share one MongoClient,
+        and therefore one connection pool. Documents are read with
+        DOCUMENT_TYPE_REGISTRY, so ObjectIds come back as strings; all other
+        codec options (e.g. tz_aware, uuidRepresentation) follow the client.
+        """
+        self.uri = uri
+        self.db_name = db_name
+        self.client = _get_client(uri, **client_options)
+        codec_options = self.client.codec_options.with_options(
+            type_registry=DOCUMENT_TYPE_REGISTRY
+        )
+        self.db = self.client.get_database(db_name, codec_options=codec_options)
+        self._collections: Dict[str, Collection] = {}
+        self._metadata_cache: Dict[Tuple[str, ...], Tuple[float, Any]] = {}
+
+    def _collection(self, name: str) -> Collection:
+        """Return a cached Collection handle for the given name."""
+        collection = self._collections.get(name)
+        if collection is None:
+            collection = self.db[name]
+            self._collections[name] = collection
+        return collection
+
+    def _cached_metadata(self, key: Tuple[str, ...], load: Callable[[], Any]) -> Any:
+        """
+        Return cached metadata for ``key``, loading it if missing or expired.
+
+        Collection names, indexes and statistics rarely change, so repeated
+        lookups within METADATA_CACHE_TTL seconds skip the server round trip.
         """
-        self.client = pymongo.MongoClient(uri)
-        self.db = self.client[db_name]
+        now = time.monotonic()
+        entry = self._metadata_cache.get(key)
+        if entry is not None and now - entry[0] < METADATA_CACHE_TTL:
+            return entry[1]
+
+        value = load()
+        self._metadata_cache[key] = (now, value)
+        return value
+
+    def _invalidate_metadata(self, *collections: str) -> None:
+        """
+        Drop cached metadata after a write.
+
+        Args:
+            *collections: Collections whose metadata may have changed. The
+                          collection list is always dropped. With no
+                          arguments, the whole cache is cleared.
+        """
+        if not collections:
+            self._metadata_cache.clear()
+            return
+
+        self._metadata_cache.pop(("collections",), None)
+        self._metadata_cache.pop(("describe",), None)
+        for collection in collections:
+            self._metadata_cache.pop(("indexes", collection), None)
+            self._metadata_cache.pop(("stats", collection), None)
 
     def list_collections(self) -> List[str]:
         """
@@ -27,7 +444,9 @@ class MongoDBTool:
         Returns:
             List[str]: A list of collection names.
         """
-        return self.db.list_collection_names()
+        return self._cached_metadata(
+            ("collections",), self.db.list_collection_names
+        )
 
     def create_collection(self, name: str) -> None:
         """
@@ -37,6 +456,7 @@ class MongoDBTool:
             name: Name of the collection to create.
         """
         self.db.create_collection(name)
+        self._invalidate_metadata(name)
 
     def drop_collection(self, name: str) -> None:
         """
@@ -45,7 +465,8 @@ class MongoDBTool:
         Args:
             name: Name of the collection to drop.
         """
-        self.db[name].drop()
+        self._collection(name).drop()
+        self._invalidate_metadata(name)
 
     def list_indexes(self, collection: str) -> List[Dict]:
         """
@@ -57,7 +478,31 @@ class MongoDBTool:
         Returns:
             List[Dict]: A list of index information dictionaries.
         """
-        return list(self.db[collection].list_indexes())
+        return self._cached_metadata(
+            ("indexes", collection),
+            lambda: list(self._collection(collection).list_indexes()),
+        )
+
+    def list_indexes_many(self, collections: List[str]) -> Dict[str, List[Dict]]:
+        """
+        List the indexes of several collections.
+
+        The requests are issued concurrently, so the round trips overlap
+        instead of adding up.
+
+        Args:
+            collections: Names of the collections.
+
+        Returns:
+            Dict[str, List[Dict]]: Mapping of collection name to its indexes.
+        """
+        if not collections:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_INDEX_WORKERS, len(collections))
+        ) as executor:
+            return dict(zip(collections, executor.map(self.list_indexes, collections)))
 
     def create_index(
         self, collection: str, keys: List[Tuple[str, int]], **options
@@ -74,7 +519,9 @@ class MongoDBTool:
         Returns:
             str: Name of the created index.
         """
-        return self.db[collection].create_index(keys, **options)
+        index_name = self._collection(collection).create_index(keys, **options)
+        self._invalidate_metadata(collection)
+        return index_name
 
     def drop_index(self, collection: str, index_name: str) -> None:
         """
@@ -84,24 +531,44 @@ class MongoDBTool:
             collection: Name of the collection.
             index_name: Name of the index to drop.
         """
-        self.db[collection].drop_index(index_name)
+        self._collection(collection).drop_index(index_name)
+        self._invalidate_metadata(collection)
 
-    def insert_document(self, collection: str, document: Dict) -> str:
+    def insert_document(
+        self,
+        collection: str,
+        document: Union[Dict, List[Dict]],
+        return_str: bool = True,
+    ) -> Union[str, ObjectId, List[Union[str, ObjectId]]]:
         """
         Insert a document into a collection.
 
         Args:
             collection: Name of the collection.
-            document: The document to insert.
+            document: The document to insert. A list of documents is inserted
+                      in one batch with insert_many_documents.
+            return_str: Optional. If False, return the inserted _id as is
+                        instead of converting it to a string.
 
         Returns:
-            str: ID of the inserted document.
+            Union[str, ObjectId, List[Union[str, ObjectId]]]: ID of the inserted
+            document, or a list of IDs when a list of documents was given.
         """
-        result = self.db[collection].insert_one(document)
-        return str(result.inserted_id)
+        if isinstance(document, list):
+            return self.insert_many_documents(
+                collection, document, return_str=return_str
+            )
+
+        result = self._collection(collection).insert_one(document)
+        self._invalidate_metadata(collection)
+        return str(result.inserted_id) if return_str else result.inserted_id
 
     def find_documents(
-        self, collection: str, filter: Dict, limit: int = 10
+        self,
+        collection: str,
+        filter: Dict,
+        limit: int = 10,
+        projection: Optional[Dict] = None,
     ) -> List[Dict]:
         """
         Find documents in a collection.
@@ -110,18 +577,65 @@ class MongoDBTool:
             collection: Name of the collection.
             filter: MongoDB filter query.
             limit: Maximum number of documents to return (default: 10).
+            projection: Optional. A dictionary specifying which fields to include
+                        or exclude. Example: {"name": 1, "email": 1, "_id": 0}.
+                        Returning only the needed fields reduces the data
+                        transferred and decoded.
 
         Returns:
             List[Dict]: List of matching documents.
         """
+        # Ask for the whole result in the first batch instead of the server's
+        # default of 101 documents followed by getMore round trips
+        batch_size = min(limit, MAX_FIND_BATCH_SIZE) if limit > 0 else None
+        return list(
+            self.iter_find(
+                collection,
+                filter,
+                limit=limit,
+                batch_size=batch_size,
+                projection=projection,
+            )
+        )
+
+    def iter_find(
+        self,
+        collection: str,
+        filter: Dict,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        projection: Optional[Dict] = None,
+    ) -> Iterator[Dict]:
+        """
+        Find documents in a collection, yielding them one at a time.
+
+        Documents are streamed from the cursor instead of being loaded into
+        memory at once, which suits large result sets.
+
+        Args:
+            collection: Name of the collection.
+            filter: MongoDB filter query.
+            limit: Optional maximum number of documents to return.
+            batch_size: Optional number of documents per server batch. Leave
+                        unset to use the server's default batching.
+            projection: Optional. A dictionary specifying which fields to include
+                        or exclude.
+
+        Returns:
+            Iterator[Dict]: Matching documents.
+        """
         # Convert ObjectId strings back to ObjectId objects
         filter = self._process_object_ids(filter)
-        
-        cursor = self.db[collection].find(filter).limit(limit)
-        return list(self._serialize_documents(cursor))
+
+        cursor = self._collection(collection).find(filter, projection)
+        if limit is not None:
+            cursor = cursor.limit(limit)
+        if batch_size is not None:
+            cursor = cursor.batch_size(batch_size)
+        yield from cursor
 
     def update_documents(
-        self, collection: str, filter: Dict, update: Dict
+        self, collection: str, filter: Dict, update: Dict, multi: Optional[bool] = None
     ) -> int:
         """
         Update documents in a collection.
@@ -130,14 +644,28 @@ class MongoDBTool:
             collection: Name of the collection.
             filter: MongoDB filter query.
             update: MongoDB update operations.
+            multi: Optional. If True, update every matching document; if False,
+                   update at most one. Defaults to a single-document update when
+                   the filter only matches an ObjectId _id, and to updating all
+                   matches otherwise.
 
         Returns:
             int: Number of documents modified.
         """
         # Convert ObjectId strings back to ObjectId objects
         filter = self._process_object_ids(filter)
-        
-        result = self.db[collection].update_many(filter, update)
+
+        if multi is None:
+            # An exact ObjectId _id match can only hit one document
+            multi = not (len(filter) == 1 and type(filter.get('_id')) is ObjectId)
+
+        target = self._collection(collection)
+        if multi:
+            result = target.update_many(filter, update)
+        else:
+            result = target.update_one(filter, update)
+        self._invalidate_metadata(collection)
+
         return result.modified_count
 
     def delete_documents(self, collection: str, filter: Dict) -> int:
@@ -154,7 +682,9 @@ class MongoDBTool:
         # Convert ObjectId strings back to ObjectId objects
         filter = self._process_object_ids(filter)
         
-        result = self.db[collection].delete_many(filter)
+        result = self._collection(collection).delete_many(filter)
+        self._invalidate_metadata(collection)
+
         return result.deleted_count
 
     def _process_object_ids(self, query: Dict) -> Dict:
@@ -169,72 +699,119 @@ class MongoDBTool:
         """
         if not query:
             return query
-            
-        result = query.copy()
-        if '_id' in result and isinstance(result['_id'], str):
-            try:
-                result['_id'] = ObjectId(result['_id'])
-            except Exception:
-                # If conversion fails, keep the original
-                pass
-                
-        # Handle $in operator for _id
-        if '_id' in result and isinstance(result['_id'], dict):
-            if '$in' in result['_id'] and isinstance(result['_id']['$in'], list):
-                result['_id']['$in'] = [
-                    ObjectId(id_str) if isinstance(id_str, str) else id_str
-                    for id_str in result['_id']['$in']
-                ]
-                
-        return result
-        
-    def _serialize_document(self, doc: Dict) -> Dict:
-        """Serialize a single MongoDB document to JSON-compatible format."""
-        serialized_doc = {}
-        for key, value in doc.items():
-            if isinstance(value, ObjectId):
-                serialized_doc[key] = str(value)
-            # Add handling for other BSON types if necessary (e.g., datetime)
-            # For example, to convert datetime objects to ISO format strings:
-            # elif isinstance(value, datetime.datetime):
-            #     serialized_doc[key] = value.isoformat()
-            else:
-                serialized_doc[key] = value
-        return serialized_doc
-
-    def _serialize_documents(self, cursor_or_list: Union[pymongo.cursor.Cursor, List[Dict]]) -> List[Dict]:
-        """
-        Serialize MongoDB documents from a cursor or list to JSON-compatible format.
-        
-        Args:
-            cursor_or_list: MongoDB cursor or list containing documents.
-            
-        Returns:
-            List[Dict]: Serialized documents.
-        """
-        result = []
-        for doc in cursor_or_list: # Works for both cursor and list
-            result.append(self._serialize_document(doc))
-        return result
 
-    def aggregate_documents(self, collection: str, pipeline: List[Dict]) -> List[Dict]:
+        # Most queries don't filter on _id; return them without copying
+        _id = query.get('_id')
+        if isinstance(_id, str):
+            if not _OBJECT_ID_RE.match(_id):
+                # Not an ObjectId string, keep the original
+                return query
+            result = query.copy()
+            result['_id'] = ObjectId(bytes.fromhex(_id))
+            return result
+
+        # Handle $in operator for _id, building a new sub-document so the
+        # caller's query is never mutated
+        if isinstance(_id, dict):
+            ids = _id.get('$in')
+            if isinstance(ids, list):
+                result = query.copy()
+                result['_id'] = {**_id, '$in': _convert_object_ids(ids)}
+                return result
+
+        return query
+
+    def aggregate_documents(
+        self,
+        collection: str,
+        pipeline: List[Dict],
+        projection: Optional[Dict] = None,
+        hint: Optional[Union[str, Dict]] = None,
+        max_time_ms: Optional[int] = None,
+    ) -> List[Dict]:
         """
         Run an aggregation pipeline on a collection.
 
+        $match stages are moved ahead of earlier stages that cannot affect
+        the fields they filter on, so the filter can use an index.
+
         Args:
             collection: Name of the collection.
             pipeline: List of aggregation pipeline stages.
+            projection: Optional. Fields to include or exclude from the results,
+                        applied on the server as a final $project stage.
+            hint: Optional. Index name or key pattern the server should use.
+            max_time_ms: Optional. Maximum server execution time in milliseconds.
 
         Returns:
             List[Dict]: Aggregation results.
         """
-        cursor = self.db[collection].aggregate(pipeline)
-        return list(self._serialize_documents(cursor))
+        writes_output = bool(pipeline) and (
+            "$out" in pipeline[-1] or "$merge" in pipeline[-1]
+        )
+        pipeline = _hoist_matches(pipeline)
+        if projection:
+            pipeline = [*pipeline, {"$project": projection}]
+
+        options: Dict[str, Any] = {}
+        if hint is not None:
+            options["hint"] = hint
+        if max_time_ms is not None:
+            options["maxTimeMS"] = max_time_ms
+
+        cursor = self._collection(collection).aggregate(pipeline, **options)
+        results = list(cursor)
+        if writes_output:
+            # $out and $merge create or replace collections and their indexes
+            self._invalidate_metadata()
+        return results
+
+    def sample_collections(
+        self, collections: List[str], limit: int = 1
+    ) -> Dict[str, List[Dict]]:
+        """
+        Fetch sample documents from several collections in a single round trip.
+
+        Args:
+            collections: Names of the collections to sample.
+            limit: Maximum number of documents to return per collection (default: 1).
+
+        Returns:
+            Dict[str, List[Dict]]: Mapping of collection name to its sample documents.
+        """
+        if not collections:
+            return {}
+
+        def sample_stages(name: str) -> List[Dict]:
+            # Tag each document with its source collection so results can be split
+            return [
+                {"$limit": limit},
+                {
+                    "$replaceWith": {
+                        "collection": {"$literal": name},
+                        "document": "$$ROOT",
+                    }
+                },
+            ]
+
+        first, *rest = collections
+        pipeline = sample_stages(first) + [
+            {"$unionWith": {"coll": name, "pipeline": sample_stages(name)}}
+            for name in rest
+        ]
+
+        samples = {name: [] for name in collections}
+        for doc in self._collection(first).aggregate(pipeline):
+            samples[doc["collection"]].append(doc["document"])
+        return samples
 
     def count_documents(self, collection: str, filter: Dict) -> int:
         """
         Count the number of documents matching a filter.
 
+        An empty filter is answered from the collection metadata, which avoids
+        scanning the whole collection.
+
         Args:
             collection: Name of the collection.
             filter: MongoDB filter query.
@@ -242,23 +819,55 @@ class MongoDBTool:
         Returns:
             int: Number of matching documents.
         """
+        if not filter:
+            return self._collection(collection).estimated_document_count()
+
         filter = self._process_object_ids(filter)
-        return self.db[collection].count_documents(filter)
+        return self._collection(collection).count_documents(filter)
 
-    def distinct_values(self, collection: str, field: str, filter: Optional[Dict] = None) -> List[Any]:
+    def distinct_values(
+        self,
+        collection: str,
+        field: str,
+        filter: Optional[Dict] = None,
+        limit: Optional[int] = None,
+        stream: bool = False,
+    ) -> Union[List[Any], Iterator[Any]]:
         """
         Get all distinct values for a field in a collection.
 
+        The distinct command returns every value in a single 16MB response.
+        When a limit is given or streaming is requested, the values are
+        computed with a $group aggregation and read from a cursor instead.
+
         Args:
             collection: Name of the collection.
             field: Field name for which to return distinct values.
             filter: Optional filter to apply before getting distinct values.
+            limit: Optional maximum number of distinct values to return.
+            stream: If True, yield values from the cursor one at a time.
 
         Returns:
-            List[Any]: List of distinct values.
+            Union[List[Any], Iterator[Any]]: Distinct values, as an iterator
+            when ``stream`` is True.
         """
         filter = self._process_object_ids(filter) if filter else {}
-        return self.db[collection].distinct(field, filter)
+        if limit is None and not stream:
+            return self._collection(collection).distinct(field, filter)
+
+        match = {field: {"$exists": True}}
+        pipeline: List[Dict] = [
+            {"$match": {"$and": [filter, match]} if filter else match},
+            {"$project": {"_id": 0, "value": _distinct_expression(field)}},
+            {"$unwind": "$value"},
+            {"$group": {"_id": "$value"}},
+        ]
+        if limit is not None:
+            pipeline.append({"$limit": limit})
+        cursor = self._collection(collection).aggregate(pipeline, allowDiskUse=True)
+
+        values = (doc["_id"] for doc in cursor)
+        return values if stream else list(values)
 
     def rename_collection(self, old_name: str, new_name: str) -> None:
         """
@@ -268,7 +877,8 @@ class MongoDBTool:
             old_name: Current name of the collection.
             new_name: New name for the collection.
         """
-        self.db[old_name].rename(new_name)
+        self._collection(old_name).rename(new_name)
+        self._invalidate_metadata(old_name, new_name)
 
     def get_collection_stats(self, collection: str) -> Dict:
         """
@@ -280,30 +890,111 @@ class MongoDBTool:
         Returns:
             Dict: Collection statistics.
         """
-        return self.db.command("collstats", collection)
+        return self._cached_metadata(
+            ("stats", collection), lambda: self.db.command("collstats", collection)
+        )
+
+    def describe_database(self) -> Dict[str, Dict]:
+        """
+        Describe every collection in the database with its indexes and statistics.
+
+        Index and storage statistics for all collections are fetched with a
+        single $unionWith aggregation. If the server rejects it (e.g. MongoDB
+        < 4.4 or missing privileges), each collection is queried separately.
+
+        Returns:
+            Dict[str, Dict]: Mapping of collection name to its type, options,
+            indexes and statistics.
+        """
+        return self._cached_metadata(("describe",), self._describe_database)
+
+    def _describe_database(self) -> Dict[str, Dict]:
+        """Build the result of describe_database without caching."""
+        description = {
+            info["name"]: {
+                "type": info.get("type", "collection"),
+                "options": info.get("options", {}),
+                "indexes": [],
+                "stats": {},
+            }
+            for info in self.db.list_collections()
+        }
+        # Views have no indexes or storage of their own
+        collections = [
+            name for name, info in description.items() if info["type"] == "collection"
+        ]
+        if not collections:
+            return description
+
+        try:
+            # On a sharded cluster $indexStats and $collStats return one
+            # document per shard, so indexes are deduplicated by name and
+            # storage statistics are summed across shards
+            seen_indexes: Set[Tuple[str, str]] = set()
+            shard_stats: Dict[str, List[Dict]] = {}
+            for doc in self._collection(collections[0]).aggregate(
+                _describe_pipeline(collections)
+            ):
+                name = doc["collection"]
+                if "index" in doc:
+                    if (name, doc["index"]["name"]) not in seen_indexes:
+                        seen_indexes.add((name, doc["index"]["name"]))
+                        description[name]["indexes"].append(doc["index"])
+                else:
+                    shard_stats.setdefault(name, []).append(doc["stats"])
+            for name, stats in shard_stats.items():
+                description[name]["stats"] = _merge_shard_stats(stats)
+        except PyMongoError:
+            for name in collections:
+                stats = self.get_collection_stats(name)
+                description[name]["indexes"] = [
+                    {"name": index["name"], "key": index["key"]}
+                    for index in self.list_indexes(name)
+                ]
+                description[name]["stats"] = {
+                    field: stats.get(field) for field in _DESCRIBE_STAT_FIELDS
+                }
+        return description
 
-    def bulk_write(self, collection: str, operations: List[Dict]) -> Dict:
+    def bulk_write(
+        self, collection: str, operations: List[Dict], ordered: Optional[bool] = None
+    ) -> Dict:
         """
         Perform bulk write operations (insert, update, delete).
 
+        All operations are sent to the server in a single batch.
+
         Args:
             collection: Name of the collection.
             operations: List of operations (dicts with 'type' and relevant fields).
+                        'type' is one of "insert" (with 'document'), "update" or
+                        "update_many" (with 'filter' and 'update'), or "delete"
+                        or "delete_many" (with 'filter').
+            ordered: Optional. If True, operations run in order and stop at the
+                     first error; if False, the server may run them in any order.
+                     Defaults to unordered for insert-only batches and ordered
+                     otherwise, since updates and deletes may depend on earlier
+                     operations.
 
         Returns:
             Dict: Bulk write result summary.
         """
-        from pymongo import InsertOne, UpdateOne, DeleteOne
-
         ops = []
-        for op in operations:
-            if op["type"] == "insert":
-                ops.append(InsertOne(op["document"]))
-            elif op["type"] == "update":
-                ops.append(UpdateOne(op["filter"], op["update"]))
-            elif op["type"] == "delete":
-                ops.append(DeleteOne(op["filter"]))
-        result = self.db[collection].bulk_write(ops)
+        try:
+            for op in operations:
+                if "filter" in op:
+                    # Convert ObjectId strings back to ObjectId objects
+                    op = {**op, "filter": self._process_object_ids(op["filter"])}
+                ops.append(_BULK_OPERATIONS[op["type"]](op))
+        except KeyError as e:
+            raise ValueError(f"Invalid bulk operation, missing or unknown {e}") from e
+
+        if ordered is None:
+            ordered = not all(op["type"] == "insert" for op in operations)
+
+        result = self._collection(collection).bulk_write(ops, ordered=ordered)
+        self._invalidate_metadata(collection)
+
         return {
             "inserted_count": result.inserted_count,
             "modified_count": result.modified_count,
@@ -328,29 +1019,72 @@ class MongoDBTool:
                             ObjectId fields are serialized to strings.
         """
         filter = self._process_object_ids(filter)
-        document = self.db[collection].find_one(filter, projection)
-        if document:
-            return self._serialize_document(document)
-        return None
+        return self._collection(collection).find_one(filter, projection)
 
-    def insert_many_documents(self, collection: str, documents: List[Dict]) -> List[str]:
+    def insert_many_documents(
+        self,
+        collection: str,
+        documents: List[Dict],
+        return_str: bool = True,
+        fast: bool = False,
+    ) -> List[Union[str, ObjectId]]:
         """
         Insert multiple documents into a collection.
 
+        Documents are inserted unordered, so one failing document does not
+        stop the rest of the batch from being written.
+
         Args:
             collection: Name of the collection.
             documents: A list of documents to insert.
+            return_str: Optional. If False, return the inserted _ids as is
+                        instead of converting them to strings.
+            fast: Optional. If True, send the batch with write concern w=0 and
+                  don't wait for the server to acknowledge it. Write errors are
+                  not reported and every _id is returned.
 
         Returns:
-            List[str]: A list of string representations of the _ids of the inserted documents.
+            List[Union[str, ObjectId]]: The _ids of the inserted documents.
+
+        Raises:
+            PartialInsertError: If some documents failed to insert. The error
+                                lists the write errors and carries the _ids of
+                                the documents that were inserted.
         """
         if not documents:
             return []
-        result = self.db[collection].insert_many(documents)
+        target = self._collection(collection)
+        if fast:
+            target = target.with_options(write_concern=WriteConcern(w=0))
+        try:
+            result = target.insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            # insert_many assigns _id to each document before sending, so the
+            # successful writes are every document without a write error
+            write_errors = e.details.get("writeErrors", [])
+            failed = {error["index"] for error in write_errors}
+            inserted_ids = [
+                document["_id"]
+                for index, document in enumerate(documents)
+                if index not in failed
+            ]
+            if return_str:
+                inserted_ids = [str(inserted_id) for inserted_id in inserted_ids]
+            raise PartialInsertError(inserted_ids, write_errors, len(documents)) from e
+        finally:
+            self._invalidate_metadata(collection)
+        if not return_str:
+            return list(result.inserted_ids)
         return [str(inserted_id) for inserted_id in result.inserted_ids]
 
     def update_one_document(
-        self, collection: str, filter: Dict, update: Dict, upsert: bool = False
+        self,
+        collection: str,
+        filter: Dict,
+        update: Dict,
+        upsert: bool = False,
+        return_doc: Optional[str] = None,
+        projection: Optional[Dict] = None,
     ) -> Dict:
         """
         Update a single document in a collection.
@@ -360,6 +1094,10 @@ class MongoDBTool:
             filter: MongoDB filter query.
             update: MongoDB update operations (e.g., using $set, $inc).
             upsert: If True, creates a new document if no document matches the filter. Default is False.
+            return_doc: Optional. "before" or "after" to also return the document
+                        as it was before or after the update, in the same round trip.
+            projection: Optional. Fields to include or exclude from the returned
+                        document. Only used with return_doc.
 
         Returns:
             Dict: A dictionary containing:
@@ -367,9 +1105,25 @@ class MongoDBTool:
                   - 'modified_count': Number of documents modified.
                   - 'upserted_id': The _id of the upserted document if an upsert occurred, else None.
                                    The _id is returned as a string.
+                  With return_doc, the server reports no counts and the dictionary
+                  instead contains:
+                  - 'document': The document before or after the update, or None
+                                if no document matched.
         """
+        if return_doc is not None:
+            document = self.find_one_and_update(
+                collection,
+                filter,
+                update,
+                projection=projection,
+                upsert=upsert,
+                return_document=return_doc,
+            )
+            return {"document": document}
+
         filter = self._process_object_ids(filter)
-        result = self.db[collection].update_one(filter, update, upsert=upsert)
+        result = self._collection(collection).update_one(filter, update, upsert=upsert)
+        self._invalidate_metadata(collection)
         upserted_id_str = str(result.upserted_id) if result.upserted_id else None
         return {
             "matched_count": result.matched_count,
@@ -389,7 +1143,8 @@ class MongoDBTool:
             int: The number of documents deleted (0 or 1).
         """
         filter = self._process_object_ids(filter)
-        result = self.db[collection].delete_one(filter)
+        result = self._collection(collection).delete_one(filter)
+        self._invalidate_metadata(collection)
         return result.deleted_count
 
     def find_one_and_update(
@@ -421,15 +1176,13 @@ class MongoDBTool:
             Optional[Dict]: The document (with ObjectIds serialized to strings)
                             or None if no document matches (and upsert is False).
         """
-        from pymongo import ReturnDocument
-
         filter = self._process_object_ids(filter)
         
-        return_doc_option = ReturnDocument.BEFORE
-        if return_document.lower() == "after":
-            return_doc_option = ReturnDocument.AFTER
+        return_doc_option = _RETURN_DOCUMENTS.get(
+            return_document.lower(), ReturnDocument.BEFORE
+        )
 
-        doc = self.db[collection].find_one_and_update(
+        doc = self._collection(collection).find_one_and_update(
             filter,
             update,
             projection=projection,
@@ -437,9 +1190,8 @@ class MongoDBTool:
             upsert=upsert,
             return_document=return_doc_option,
         )
-        if doc:
-            return self._serialize_document(doc)
-        return None
+        self._invalidate_metadata(collection)
+        return doc
 
     def run_command(self, command: Union[Dict, str], **kwargs) -> Dict:
         """
@@ -455,19 +1207,8 @@ class MongoDBTool:
         """
         raw_result = self.db.command(command, **kwargs)
 
-        # Recursively serialize known BSON types to JSON-friendly formats.
-        def serialize_value(value: Any) -> Any:
-            if isinstance(value, ObjectId):
-                return str(value)
-            elif isinstance(value, list):
-                return [serialize_value(v) for v in value]
-            elif isinstance(value, dict):
-                return {k: serialize_value(v) for k, v in value.items()}
-            # Example: Add datetime serialization if needed
-            # import datetime # Add to top-level imports if used here
-            # from bson.datetime_ms import DatetimeMS # Add to top-level imports if used here
-            # if isinstance(value, datetime.datetime) or isinstance(value, DatetimeMS):
-            #    return value.isoformat()
-            return value
-
-        return serialize_value(raw_result)
+        # Arbitrary commands may change collections or indexes
+        self._invalidate_metadata()
+
+        # The command result is a fresh document, so it is converted in place
+        return _serialize_bson_in_place(raw_result)
@@ -0,0 +1,52 @@
+"""Shared MongoDBTool instances for reusing MongoDB connection pools."""
+
+import functools
+import importlib.util
+
+from mongo_llm_cli.mongodb_tool import MongoDBTool
+
+
+def _available_compressors() -> str:
+    """
+    Return the wire compressors to offer the server, best first.
+
+    zstd and snappy need optional packages; PyMongo warns about listed
+    compressors whose package is missing, so only installed ones are offered.
+    zlib is built in and always available.
+    """
+    compressors = [
+        name
+        for name, module in (("zstd", "zstandard"), ("snappy", "snappy"))
+        if importlib.util.find_spec(module) is not None
+    ]
+    compressors.append("zlib")
+    return ",".join(compressors)
+
+
+# Connection pool settings for the shared MongoClient
+CLIENT_OPTIONS = {
+    "maxPoolSize": 50,
+    "maxIdleTimeMS": 60000,
+    "retryWrites": True,
+    "compressors": _available_compressors(),
+    "zlibCompressionLevel": 6,
+}
+
+
+@functools.lru_cache(maxsize=4)
+def get_tool(uri: str, db_name: str) -> MongoDBTool:
+    """
+    Get a shared MongoDBTool for a connection URI and database.
+
+    Creating a MongoClient performs server discovery and connection handshakes,
+    so tools are cached per (uri, db_name) and their connection pool is reused
+    by every command run in the same process.
+
+    Args:
+        uri: MongoDB connection URI.
+        db_name: Name of the database to use.
+
+    Returns:
+        MongoDBTool: The shared tool instance.
+    """
+    return MongoDBTool(uri, db_name, **CLIENT_OPTIONS)
@@ -1,11 +1,12 @@
 """Translator for LLM responses to executable tool calls."""
 
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from typing import Any, Dict, NamedTuple, Optional
 
+# Fields every LLM response must contain
+_REQUIRED_FIELDS = frozenset(("tool", "args"))
 
-@dataclass
-class ParsedQuery:
+
+class ParsedQuery(NamedTuple):
     """Parsed query from the LLM."""
 
     tool: str
@@ -25,21 +26,21 @@ def translate(llm_response: Dict[str, Any]) -> ParsedQuery:
     Raises:
         ValueError: If the response is invalid or missing required fields.
     """
-    if not isinstance(llm_response, dict):
+    if type(llm_response) is not dict:
         raise ValueError(f"Expected a dictionary response, got: {type(llm_response)}")
 
     # Check for required fields
-    if "tool" not in llm_response:
-        raise ValueError("Missing 'tool' field in LLM response")
-    
-    if "args" not in llm_response:
-        raise ValueError("Missing 'args' field in LLM response")
-    
+    missing = _REQUIRED_FIELDS.difference(llm_response)
+    if missing:
+        fields = ", ".join(f"'{field}'" for field in sorted(missing))
+        plural = "s" if len(missing) > 1 else ""
+        raise ValueError(f"Missing {fields} field{plural} in LLM response")
+
     tool_name = llm_response["tool"]
     args = llm_response["args"]
-    
+
     # Validate args is a dictionary
-    if not isinstance(args, dict):
+    if type(args) is not dict:
         raise ValueError(f"Expected 'args' to be a dictionary, got: {type(args)}")
-    
-    return ParsedQuery(tool=tool_name, args=args) 
\ No newline at end of file
+
+    return ParsedQuery(tool=tool_name, args=args)
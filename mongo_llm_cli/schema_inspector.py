@@ -1,40 +1,159 @@
 """MongoDB schema inspection utilities."""
 
-from typing import Dict, List, Any
+import hashlib
+import json
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Any, Optional
 
+from mongo_llm_cli.config import DEFAULT_SCHEMA_CACHE_TTL
+from mongo_llm_cli.formatter import to_json
 from mongo_llm_cli.mongodb_tool import MongoDBTool
 
+# Upper bound on concurrent sample-document fetches during inspection
+MAX_SAMPLE_WORKERS = 16
 
-def inspect_schema(tool: MongoDBTool) -> Dict[str, Any]:
+
+def inspect_schema(
+    tool: MongoDBTool, ttl: int = DEFAULT_SCHEMA_CACHE_TTL, refresh: bool = False
+) -> Dict[str, Any]:
     """
     Inspect the database schema and return a structured representation.
 
     This function examines collections in the database and collects
     sample documents to provide context about the data structure.
+    Results are cached on disk per (URI, database) pair for ``ttl`` seconds
+    so that repeated queries skip the round trips to MongoDB.
 
     Args:
         tool: Instance of MongoDBTool connected to a database.
+        ttl: Number of seconds a cached schema stays valid. A value of 0
+             or less disables the cache.
+        refresh: If True, ignore any cached schema and inspect the database.
 
     Returns:
         Dict[str, Any]: Dictionary containing collections and sample documents.
     """
+    cache_path = _cache_path(tool) if ttl > 0 else None
+
+    if cache_path is not None and not refresh:
+        cached = _load_cached_schema(cache_path, ttl)
+        if cached is not None:
+            return cached
+
     collections = tool.list_collections()
     schema = {
         "collections": collections,
         "sample_documents": {},
     }
 
-    # Get one sample document from each collection
-    for collection in collections:
-        try:
-            # Find one document in the collection
-            sample = tool.find_documents(collection, {}, limit=1)
-            if sample:
-                schema["sample_documents"][collection] = sample[0]
-            else:
-                schema["sample_documents"][collection] = {}
-        except Exception as e:
-            # If there's an error getting a sample, log it and continue
-            schema["sample_documents"][collection] = {"error": str(e)}
-
-    return schema 
\ No newline at end of file
+    # Get one sample document from each collection. A single $unionWith
+    # aggregation covers all collections in one round trip; if the server
+    # rejects it (e.g. MongoDB < 4.4), fetch the samples concurrently so the
+    # per-collection round trips overlap instead of adding up
+    try:
+        samples = tool.sample_collections(collections, limit=1)
+    except Exception:
+        samples = None
+
+    if samples is not None:
+        for collection in collections:
+            sample = samples.get(collection)
+            schema["sample_documents"][collection] = sample[0] if sample else {}
+    elif collections:
+        with ThreadPoolExecutor(
+            max_workers=min(MAX_SAMPLE_WORKERS, len(collections))
+        ) as executor:
+            futures = {
+                collection: executor.submit(
+                    tool.find_documents, collection, {}, limit=1
+                )
+                for collection in collections
+            }
+
+        for collection, future in futures.items():
+            try:
+                sample = future.result()
+                if sample:
+                    schema["sample_documents"][collection] = sample[0]
+                else:
+                    schema["sample_documents"][collection] = {}
+            except Exception as e:
+                # If there's an error getting a sample, log it and continue
+                schema["sample_documents"][collection] = {"error": str(e)}
+
+    if cache_path is not None:
+        _save_cached_schema(cache_path, schema)
+
+    return schema
+
+
+def _cache_dir() -> Path:
+    """Return the directory used for cached schemas."""
+    base = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "mongo_llm_cli"
+
+
+def _cache_path(tool: MongoDBTool) -> Path:
+    """Return the cache file path for the tool's URI and database."""
+    cache_key = hashlib.sha1(f"{tool.uri}\0{tool.db_name}".encode()).hexdigest()
+    return _cache_dir() / f"schema-{cache_key}.json"
+
+
+def _load_cached_schema(path: Path, ttl: int) -> Optional[Dict[str, Any]]:
+    """Load a cached schema if it exists and is younger than ``ttl`` seconds."""
+    try:
+        if time.time() - path.stat().st_mtime >= ttl:
+            return None
+        with path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        # Missing or unreadable cache entries are treated as a cache miss
+        return None
+
+
+def _save_cached_schema(path: Path, schema: Dict[str, Any]) -> None:
+    """Write a schema to the cache, ignoring any filesystem errors."""
+    tmp_path = None
+    try:
+        # Sample documents may hold sensitive data, so keep them owner-only;
+        # NamedTemporaryFile creates its file with mode 0600
+        path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        # A unique temporary file per write keeps concurrent runs from
+        # interleaving their output before the atomic replace
+        with tempfile.NamedTemporaryFile(
+            "w",
+            encoding="utf-8",
+            dir=path.parent,
+            prefix=f"{path.stem}-",
+            suffix=".tmp",
+            delete=False,
+        ) as f:
+            tmp_path = f.name
+            f.write(to_json(schema))
+        os.replace(tmp_path, path)
+    except (OSError, TypeError, ValueError):
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+
+
+def clear_schema_cache(tool: MongoDBTool) -> None:
+    """
+    Delete the cached schema for the tool's URI and database.
+
+    Called after operations that change the collection list so the next
+    inspection doesn't hand the LLM a stale schema.
+
+    Args:
+        tool: Instance of MongoDBTool whose cached schema should be dropped.
+    """
+    try:
+        _cache_path(tool).unlink()
+    except OSError:
+        pass
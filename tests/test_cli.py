@@ -1,5 +1,7 @@
 """Tests for the CLI module."""
 
+import subprocess
+import sys
 from unittest import mock
 
 import pytest
@@ -23,6 +25,7 @@ def mock_config():
         mock_config.mongo_uri = "mongodb://localhost:27017"
         mock_config.mongo_db_name = "test_db"
         mock_config.gemini_api_key = "fake_api_key"
+        mock_config.schema_cache_ttl = 300
         
         # Set the return value of get_config
         mock_get_config.return_value = mock_config
@@ -33,13 +36,13 @@ def mock_config():
 @pytest.fixture
 def mock_mongodb_tool():
     """Mock the MongoDB tool."""
-    with mock.patch("mongo_llm_cli.cli.MongoDBTool") as mock_tool_class:
+    with mock.patch("mongo_llm_cli.cli.get_tool") as mock_get_tool:
         # Create a mock tool instance
         mock_tool = mock.MagicMock()
         mock_tool.list_collections.return_value = ["users", "products"]
         
-        # Set the return value of the constructor
-        mock_tool_class.return_value = mock_tool
+        # Set the return value of the shared tool factory
+        mock_get_tool.return_value = mock_tool
         
         yield mock_tool
 
@@ -68,14 +71,15 @@ def test_test_connection_failure(runner, mock_config, mock_mongodb_tool):
     assert "Connection failed" in result.output
 
 
-@mock.patch("mongo_llm_cli.cli.inspect_schema")
-@mock.patch("mongo_llm_cli.cli.llm_orchestrator.call_llm")
+@mock.patch("mongo_llm_cli.schema_inspector.inspect_schema")
+@mock.patch("mongo_llm_cli.llm_orchestrator.get_model")
+@mock.patch("mongo_llm_cli.llm_orchestrator.call_llm")
 @mock.patch("mongo_llm_cli.cli.translate")
-@mock.patch("mongo_llm_cli.cli.execute")
+@mock.patch("mongo_llm_cli.executor.execute")
 @mock.patch("mongo_llm_cli.cli.format_print")
 def test_run_command(
-    mock_format_print, mock_execute, mock_translate, mock_call_llm, mock_inspect_schema,
-    runner, mock_config, mock_mongodb_tool
+    mock_format_print, mock_execute, mock_translate, mock_call_llm, mock_get_model,
+    mock_inspect_schema, runner, mock_config, mock_mongodb_tool
 ):
     """Test the run command."""
     # Set up mock returns
@@ -96,7 +100,10 @@ def test_run_command(
     assert "Executing: list_collections" in result.output
     
     # Verify mock calls
-    mock_inspect_schema.assert_called_once_with(mock_mongodb_tool)
+    mock_inspect_schema.assert_called_once_with(
+        mock_mongodb_tool, ttl=300, refresh=False
+    )
+    mock_get_model.assert_called_once_with(mock_config.return_value.gemini_api_key)
     mock_call_llm.assert_called_once_with(
         "list all collections",
         mock_inspect_schema.return_value,
@@ -104,7 +111,7 @@ def test_run_command(
     )
     mock_translate.assert_called_once_with(mock_call_llm.return_value)
     mock_execute.assert_called_once_with(mock_mongodb_tool, mock_translate.return_value)
-    mock_format_print.assert_called_once_with(mock_execute.return_value)
+    mock_format_print.assert_called_once_with(mock_execute.return_value, limit=None)
 
 
 def test_run_command_no_query(runner):
@@ -114,4 +121,78 @@ def test_run_command_no_query(runner):
     
     # Check failure
     assert result.exit_code == 1
-    assert "Error: No query provided" in result.output 
\ No newline at end of file
+    assert "Error: No query provided" in result.output 
+
+
+def test_cli_import_skips_llm_client():
+    """Test that importing the CLI doesn't import the Gemini client."""
+    code = "import sys, mongo_llm_cli.cli; print('google.generativeai' in sys.modules)"
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+
+    assert result.stdout.strip() == "False"
+
+
+@mock.patch("mongo_llm_cli.schema_inspector.inspect_schema")
+@mock.patch("mongo_llm_cli.llm_orchestrator.get_model")
+@mock.patch("mongo_llm_cli.llm_orchestrator.call_llm")
+@mock.patch("mongo_llm_cli.executor.execute")
+@mock.patch("mongo_llm_cli.cli.format_print")
+@pytest.mark.parametrize(
+    "args, stdin, executed",
+    [
+        (["run", "drop users"], "n\n", False),
+        (["run", "drop users"], "y\n", True),
+        (["--yes", "run", "drop users"], "", True),
+    ],
+)
+def test_run_destructive_confirmation(
+    mock_format_print, mock_execute, mock_call_llm, mock_get_model, mock_inspect_schema,
+    args, stdin, executed, runner, mock_config, mock_mongodb_tool
+):
+    """Test confirmation of destructive operations, with and without --yes."""
+    mock_call_llm.return_value = {"tool": "drop_collection", "args": {"collection": "users"}}
+    mock_execute.return_value = {"success": True, "data": None, "error": None}
+
+    result = runner.invoke(mongo_llm, args, input=stdin)
+
+    assert mock_execute.called is executed
+    if executed:
+        assert result.exit_code == 0
+    else:
+        assert "Operation aborted" in result.output
+
+
+@mock.patch("mongo_llm_cli.schema_inspector.inspect_schema")
+@mock.patch("mongo_llm_cli.llm_orchestrator.get_model")
+@mock.patch("mongo_llm_cli.llm_orchestrator.call_llm")
+@mock.patch("mongo_llm_cli.executor.execute")
+@mock.patch("mongo_llm_cli.cli.format_print")
+@pytest.mark.parametrize(
+    "operations, stdin, executed",
+    [
+        ([{"type": "delete_many", "filter": {}}], "n\n", False),
+        ([{"type": "insert", "document": {}}, {"type": "delete", "filter": {}}], "n\n", False),
+        ([{"type": "delete_many", "filter": {}}], "y\n", True),
+        ([{"type": "insert", "document": {"name": "Bob"}}], "", True),
+    ],
+)
+def test_run_bulk_write_delete_confirmation(
+    mock_format_print, mock_execute, mock_call_llm, mock_get_model, mock_inspect_schema,
+    operations, stdin, executed, runner, mock_config, mock_mongodb_tool
+):
+    """Test that bulk writes containing deletes require confirmation."""
+    mock_call_llm.return_value = {
+        "tool": "bulk_write",
+        "args": {"collection": "users", "operations": operations},
+    }
+    mock_execute.return_value = {"success": True, "data": None, "error": None}
+
+    result = runner.invoke(mongo_llm, ["run", "clean up users"], input=stdin)
+
+    assert mock_execute.called is executed
+    if executed:
+        assert result.exit_code == 0
+    else:
+        assert "Operation aborted" in result.output
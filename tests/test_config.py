@@ -9,6 +9,14 @@ import pytest
 from mongo_llm_cli.config import get_config, Config
 
 
+@pytest.fixture(autouse=True)
+def clear_config_cache():
+    """Reload the configuration in every test."""
+    get_config.cache_clear()
+    yield
+    get_config.cache_clear()
+
+
 def test_get_config_from_env():
     """Test loading configuration from environment variables."""
     # Mock environment variables
@@ -70,4 +78,40 @@ def test_config_file_not_found():
     with pytest.raises(ValueError) as excinfo:
         get_config("nonexistent_file.env")
     
-    assert "not found" in str(excinfo.value) 
\ No newline at end of file
+    assert "not found" in str(excinfo.value) 
+
+
+def test_schema_cache_ttl():
+    """Test the optional schema cache TTL setting."""
+    env = {
+        "MONGO_URI": "mongodb://localhost:27017",
+        "MONGO_DB_NAME": "test_db",
+        "GEMINI_API_KEY": "fake_api_key",
+    }
+    with mock.patch.dict(os.environ, env, clear=True):
+        assert get_config().schema_cache_ttl == 300
+
+    get_config.cache_clear()
+    with mock.patch.dict(os.environ, {**env, "SCHEMA_CACHE_TTL": "60"}, clear=True):
+        assert get_config().schema_cache_ttl == 60
+
+    get_config.cache_clear()
+    with mock.patch.dict(os.environ, {**env, "SCHEMA_CACHE_TTL": "soon"}, clear=True):
+        with pytest.raises(ValueError) as excinfo:
+            get_config()
+        assert "SCHEMA_CACHE_TTL" in str(excinfo.value)
+
+
+def test_get_config_is_cached():
+    """Test that repeated calls reuse the loaded configuration."""
+    with mock.patch.dict(os.environ, {
+        "MONGO_URI": "mongodb://localhost:27017",
+        "MONGO_DB_NAME": "test_db",
+        "GEMINI_API_KEY": "fake_api_key",
+    }):
+        with mock.patch("mongo_llm_cli.config.load_dotenv") as mock_load_dotenv:
+            first = get_config()
+            second = get_config()
+
+    assert first is second
+    assert mock_load_dotenv.call_count <= 1
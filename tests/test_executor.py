@@ -0,0 +1,78 @@
+"""Tests for the executor."""
+
+from unittest import mock
+
+from mongo_llm_cli.executor import execute
+from mongo_llm_cli.mongodb_tool import MongoDBTool
+from mongo_llm_cli.query_translator import ParsedQuery
+
+
+def test_execute_success():
+    """Test dispatching a tool call to MongoDBTool."""
+    tool = MongoDBTool.__new__(MongoDBTool)
+    tool.db = mock.MagicMock()
+    tool._metadata_cache = {}
+    tool.db.list_collection_names.return_value = ["users"]
+
+    result = execute(tool, ParsedQuery(tool="list_collections", args={}))
+
+    assert result == {"success": True, "data": ["users"], "error": None}
+
+
+def test_execute_clears_schema_cache():
+    """Test that tools changing the collection list clear the cached schema."""
+    tool = MongoDBTool.__new__(MongoDBTool)
+    tool.db = mock.MagicMock()
+    tool._metadata_cache = {}
+
+    with mock.patch("mongo_llm_cli.executor.clear_schema_cache") as clear:
+        execute(tool, ParsedQuery(tool="list_collections", args={}))
+        clear.assert_not_called()
+
+        result = execute(tool, ParsedQuery(tool="create_collection", args={"name": "users"}))
+        assert result["success"] is True
+        clear.assert_called_once_with(tool)
+
+
+def test_execute_unknown_method():
+    """Test that unknown and private methods are rejected."""
+    tool = mock.MagicMock(spec=MongoDBTool)
+
+    for name in ("drop_database", "_process_object_ids", "client"):
+        result = execute(tool, ParsedQuery(tool=name, args={}))
+        assert result == {"success": False, "error": f"Unknown method: {name}", "data": None}
+
+
+def test_execute_error():
+    """Test that exceptions from the tool are reported as failures."""
+    tool = MongoDBTool.__new__(MongoDBTool)
+
+    result = execute(tool, ParsedQuery(tool="find_documents", args={"bogus": 1}))
+
+    assert result["success"] is False
+    assert "bogus" in result["error"]
+
+
+def test_execute_streaming_error():
+    """Test that errors from streaming results are reported by execute."""
+    tool = MongoDBTool.__new__(MongoDBTool)
+    tool._collections = {}
+    tool.db = mock.MagicMock()
+    tool.db.__getitem__.return_value.find.side_effect = Exception("not authorized")
+
+    result = execute(tool, ParsedQuery(tool="iter_find", args={"collection": "users", "filter": {}}))
+
+    assert result == {"success": False, "error": "not authorized", "data": None}
+
+
+def test_execute_streaming_success():
+    """Test that streaming results are returned lazily and complete."""
+    tool = MongoDBTool.__new__(MongoDBTool)
+    tool._collections = {}
+    tool.db = mock.MagicMock()
+    tool.db.__getitem__.return_value.find.return_value = iter([{"n": 1}, {"n": 2}])
+
+    result = execute(tool, ParsedQuery(tool="iter_find", args={"collection": "users", "filter": {}}))
+
+    assert result["success"] is True
+    assert list(result["data"]) == [{"n": 1}, {"n": 2}]
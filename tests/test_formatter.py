@@ -0,0 +1,102 @@
+"""Tests for the result formatter."""
+
+import json
+from datetime import datetime
+
+from bson.objectid import ObjectId
+
+from mongo_llm_cli.formatter import print as format_print
+
+
+def test_print_documents(capsys):
+    """Test printing a list of documents as JSON."""
+    docs = [
+        {
+            "_id": ObjectId("5f50c31e8a91e73550a97d5f"),
+            "name": "John",
+            "created": datetime(2024, 1, 2, 3, 4, 5),
+        }
+    ]
+
+    format_print({"success": True, "data": docs, "error": None})
+
+    output = capsys.readouterr().out
+    assert json.loads(output) == [
+        {
+            "_id": "5f50c31e8a91e73550a97d5f",
+            "name": "John",
+            "created": "2024-01-02T03:04:05",
+        }
+    ]
+    assert '\n  {\n    "_id"' in output
+
+
+def test_print_dict(capsys):
+    """Test printing a dictionary as JSON."""
+    format_print({"success": True, "data": {"matched_count": 1}, "error": None})
+
+    assert json.loads(capsys.readouterr().out) == {"matched_count": 1}
+
+
+def test_print_simple_list(capsys):
+    """Test printing a list of scalars as a numbered list."""
+    format_print({"success": True, "data": ["users", "products"], "error": None})
+
+    assert capsys.readouterr().out == "1. users\n2. products\n"
+
+
+def test_print_error(capsys):
+    """Test printing an error result."""
+    format_print({"success": False, "data": None, "error": "boom"})
+
+    assert "Error: boom" in capsys.readouterr().out
+
+
+def test_print_list_limit(capsys):
+    """Test truncating a list to the output limit."""
+    format_print({"success": True, "data": ["a", "b", "c"], "error": None}, limit=2)
+
+    assert capsys.readouterr().out == (
+        "1. a\n2. b\n... 1 more items not shown (use --limit-output to change)\n"
+    )
+
+
+def test_print_large_list_streams_lines(capsys, monkeypatch):
+    """Test that large document lists are streamed one JSON line per item."""
+    monkeypatch.setattr("mongo_llm_cli.formatter.PAGER_THRESHOLD", 2)
+    docs = [{"n": 1}, {"n": 2}, {"_id": ObjectId("5f50c31e8a91e73550a97d5f")}]
+
+    format_print({"success": True, "data": docs, "error": None})
+
+    assert capsys.readouterr().out.splitlines() == [
+        '{"n":1}',
+        '{"n":2}',
+        '{"_id":"5f50c31e8a91e73550a97d5f"}',
+    ]
+
+
+def test_print_mixed_simple_list(capsys):
+    """Test printing a list of non-scalar, non-document values."""
+    values = [datetime(2024, 1, 2), ObjectId("5f50c31e8a91e73550a97d5f")]
+
+    format_print({"success": True, "data": values, "error": None})
+
+    assert capsys.readouterr().out == (
+        "1. 2024-01-02T00:00:00\n2. 5f50c31e8a91e73550a97d5f\n"
+    )
+
+
+def test_print_scalars_mixed_with_documents(capsys):
+    """Test that documents after a scalar are still printed as JSON."""
+    format_print({"success": True, "data": [1, {"a": 2}], "error": None})
+
+    assert capsys.readouterr().out == '1. 1\n2. {"a": 2}\n'
+
+
+def test_print_iterator(capsys):
+    """Test streaming documents from an iterator."""
+    docs = iter([{"n": 1}, {"n": 2}, {"n": 3}])
+
+    format_print({"success": True, "data": docs, "error": None}, limit=2)
+
+    assert capsys.readouterr().out == '{"n":1}\n{"n":2}\n'
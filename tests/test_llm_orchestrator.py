@@ -0,0 +1,120 @@
+"""Tests for the LLM orchestrator module."""
+
+import json
+from datetime import datetime
+from unittest import mock
+
+import pytest
+from bson.objectid import ObjectId
+
+from mongo_llm_cli.llm_orchestrator import (
+    _find_json_object,
+    build_tool_schema,
+    call_llm,
+    construct_prompt,
+    get_model,
+)
+
+
+@pytest.fixture
+def mock_genai():
+    """Mock the Gemini client functions used by the orchestrator."""
+    with mock.patch("google.generativeai.configure") as mock_configure, \
+            mock.patch("google.generativeai.GenerativeModel") as mock_model:
+        yield mock.MagicMock(configure=mock_configure, GenerativeModel=mock_model)
+
+
+@pytest.fixture(autouse=True)
+def clear_model_cache():
+    """Configure a fresh model in every test."""
+    get_model.cache_clear()
+    yield
+    get_model.cache_clear()
+
+
+def test_build_tool_schema_is_cached():
+    """Test that the tool schema is built once and reused."""
+    first = build_tool_schema()
+    second = build_tool_schema()
+
+    assert first is second
+    method_names = [method["name"] for method in first["methods"]]
+    assert "find_documents" in method_names
+    assert not any(name.startswith("_") for name in method_names)
+
+
+def test_construct_prompt_includes_context():
+    """Test that the prompt contains the tool schema, schema, and query."""
+    tool_schema = build_tool_schema()
+    schema = {
+        "collections": ["users"],
+        "sample_documents": {"users": {"_id": ObjectId("5f50c31e8a91e73550a97d5f"), "joined": datetime(2024, 1, 2)}},
+    }
+
+    prompt = construct_prompt("list all collections", schema, tool_schema)
+
+    assert json.dumps(tool_schema, indent=2) in prompt
+    assert '"users"' in prompt
+    assert '"_id": "5f50c31e8a91e73550a97d5f"' in prompt
+    assert '"joined": "2024-01-02T00:00:00"' in prompt
+    assert 'User query: "list all collections"' in prompt
+    assert '"projection"' in prompt
+    assert "find_one_document, iter_find or aggregate_documents" in prompt
+
+
+def _stream(*texts):
+    """Build a fake streamed Gemini response from text chunks."""
+    return [mock.MagicMock(text=text) for text in texts]
+
+
+def test_call_llm_returns_first_complete_object(mock_genai):
+    """Test that the stream is abandoned once a JSON object is complete."""
+    model = mock_genai.GenerativeModel.return_value
+    chunks = _stream('```json\n{"tool": "find_documents", ', '"args": {"filter": {"name": "{x}"}}}', "\n```")
+    model.generate_content.return_value = iter(chunks)
+
+    result = call_llm("find x", {}, "fake_api_key")
+
+    assert result == {"tool": "find_documents", "args": {"filter": {"name": "{x}"}}}
+    assert model.generate_content.call_args.kwargs["stream"] is True
+    mock_genai.configure.assert_called_once_with(api_key="fake_api_key")
+
+
+def test_call_llm_invalid_response(mock_genai):
+    """Test that an unparseable response raises a ValueError."""
+    model = mock_genai.GenerativeModel.return_value
+    model.generate_content.return_value = iter(_stream("I cannot help with that."))
+
+    with pytest.raises(ValueError) as excinfo:
+        call_llm("find x", {}, "fake_api_key")
+
+    assert "I cannot help with that." in str(excinfo.value)
+
+
+def test_find_json_object():
+    """Test detection of a complete top-level JSON object."""
+    assert _find_json_object('{"a": 1') is None
+    assert _find_json_object('text {"a": "}"} more') == '{"a": "}"}'
+    assert _find_json_object('{"a": "\\"}"}, {"b": 2}') == '{"a": "\\"}"}'
+    assert _find_json_object("no json here") is None
+
+
+@mock.patch("mongo_llm_cli.llm_orchestrator._find_json_object", return_value=None)
+def test_call_llm_strips_code_fence(_mock_find, mock_genai):
+    """Test parsing a full response wrapped in a markdown code block."""
+    model = mock_genai.GenerativeModel.return_value
+    model.generate_content.return_value = iter(
+        _stream('Here you go:\n```json\n{"tool": "list_collections", "args": {}}\n```')
+    )
+
+    assert call_llm("list", {}, "fake_api_key") == {"tool": "list_collections", "args": {}}
+
+
+def test_get_model_is_cached(mock_genai):
+    """Test that the Gemini client is configured once per API key."""
+    first = get_model("fake_api_key")
+    second = get_model("fake_api_key")
+
+    assert first is second
+    mock_genai.configure.assert_called_once_with(api_key="fake_api_key")
+    mock_genai.GenerativeModel.assert_called_once()
@@ -1,23 +1,36 @@
 """Tests for the MongoDB tool."""
 
+from datetime import datetime, timezone
 from unittest import mock
 
+import bson
 import pytest
+from bson.binary import UuidRepresentation
 from bson.objectid import ObjectId
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.errors import BulkWriteError, OperationFailure
+from pymongo import DeleteMany, DeleteOne, InsertOne, ReturnDocument, UpdateMany, UpdateOne
 from pymongo.results import DeleteResult, InsertOneResult, UpdateResult
 
-from mongo_llm_cli.mongodb_tool import MongoDBTool
+from mongo_llm_cli.mongodb_tool import (
+    DOCUMENT_TYPE_REGISTRY,
+    MongoDBTool,
+    PartialInsertError,
+    _distinct_expression,
+    close_shared_clients,
+)
+from mongo_llm_cli.pool import _available_compressors, get_tool
 
 
 @pytest.fixture
 def mock_mongodb():
     """Fixture for mocking MongoDB client, database, and collections."""
+    close_shared_clients()
     with mock.patch("pymongo.MongoClient") as mock_client:
         # Mock the database
         mock_db = mock.MagicMock(spec=Database)
-        mock_client.return_value.__getitem__.return_value = mock_db
+        mock_client.return_value.get_database.return_value = mock_db
         
         # Mock a collection
         mock_collection = mock.MagicMock(spec=Collection)
@@ -27,6 +40,7 @@ def mock_mongodb():
         mock_db.list_collection_names.return_value = ["users", "products"]
         
         yield mock_client, mock_db, mock_collection
+        close_shared_clients()
 
 
 def test_list_collections(mock_mongodb):
@@ -141,15 +155,18 @@ def test_insert_document(mock_mongodb):
     assert result == str(mock_id)
     mock_collection.insert_one.assert_called_once_with(doc)
 
+    # The raw ObjectId is returned when requested
+    assert tool.insert_document("users", doc, return_str=False) is mock_id
+
 
 def test_find_documents(mock_mongodb):
     """Test finding documents."""
     _, _, mock_collection = mock_mongodb
     mock_docs = [
-        {"_id": ObjectId("5f50c31e8a91e73550a97d5f"), "name": "John"},
-        {"_id": ObjectId("5f50c31e8a91e73550a97d60"), "name": "Jane"}
+        {"_id": "5f50c31e8a91e73550a97d5f", "name": "John"},
+        {"_id": "5f50c31e8a91e73550a97d60", "name": "Jane"}
     ]
-    mock_collection.find.return_value.limit.return_value = mock_docs
+    mock_collection.find.return_value.limit.return_value.batch_size.return_value = mock_docs
     
     # Create tool instance
     tool = MongoDBTool("mongodb://localhost:27017", "test_db")
@@ -160,10 +177,11 @@ def test_find_documents(mock_mongodb):
     
     # Assert
     assert len(docs) == 2
-    assert docs[0]["_id"] == str(mock_docs[0]["_id"])
+    assert docs[0]["_id"] == "5f50c31e8a91e73550a97d5f"
     assert docs[1]["name"] == "Jane"
-    mock_collection.find.assert_called_once_with(filter_query)
+    mock_collection.find.assert_called_once_with(filter_query, None)
     mock_collection.find.return_value.limit.assert_called_once_with(2)
+    mock_collection.find.return_value.limit.return_value.batch_size.assert_called_once_with(2)
 
 
 def test_update_documents(mock_mongodb):
@@ -186,6 +204,31 @@ def test_update_documents(mock_mongodb):
     mock_collection.update_many.assert_called_once_with(filter_query, update)
 
 
+def test_update_documents_by_id(mock_mongodb):
+    """Test that updates targeting a single _id use update_one."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.update_one.return_value = UpdateResult(
+        {"n": 1, "nModified": 1}, acknowledged=True
+    )
+    oid = ObjectId("5f50c31e8a91e73550a97d5f")
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    update = {"$set": {"active": True}}
+    result = tool.update_documents("users", {"_id": str(oid)}, update)
+
+    # Assert
+    assert result == 1
+    mock_collection.update_one.assert_called_once_with({"_id": oid}, update)
+    mock_collection.update_many.assert_not_called()
+
+    # An explicit multi=True still updates every match
+    tool.update_documents("users", {"_id": str(oid)}, update, multi=True)
+    mock_collection.update_many.assert_called_once_with({"_id": oid}, update)
+
+
 def test_delete_documents(mock_mongodb):
     """Test deleting documents."""
     _, _, mock_collection = mock_mongodb
@@ -223,4 +266,665 @@ def test_process_object_ids():
     # Test with invalid ObjectId string (should remain unchanged)
     query = {"_id": "invalid-object-id"}
     processed = tool._process_object_ids(query)
-    assert processed["_id"] == "invalid-object-id" 
\ No newline at end of file
+    assert processed["_id"] == "invalid-object-id"
+
+    # Test that queries without a string _id are returned as-is
+    query = {"name": "John"}
+    assert tool._process_object_ids(query) is query
+
+    # Test that the caller's $in list is not modified
+    ids = ["5f50c31e8a91e73550a97d5f"]
+    query = {"_id": {"$in": ids}}
+    processed = tool._process_object_ids(query)
+    assert ids == ["5f50c31e8a91e73550a97d5f"]
+    assert query == {"_id": {"$in": ids}} 
+
+    # Test that mixed $in lists keep non-string values
+    query = {"_id": {"$in": ["5f50c31e8a91e73550a97d5f", 42]}}
+    processed = tool._process_object_ids(query)
+    assert processed["_id"]["$in"] == [ObjectId("5f50c31e8a91e73550a97d5f"), 42]
+
+    # Test that invalid strings in $in lists are kept as they are
+    query = {"_id": {"$in": ["5f50c31e8a91e73550a97d5f", "custom-id"]}}
+    processed = tool._process_object_ids(query)
+    assert processed["_id"]["$in"] == [ObjectId("5f50c31e8a91e73550a97d5f"), "custom-id"]
+
+    # Test that whitespace-padded hex strings are not treated as ObjectIds
+    query = {"_id": {"$in": ["5f50c31e8a91e73550a97d5f ", "5f50c31e8a91e73550a97d60"]}}
+    processed = tool._process_object_ids(query)
+    assert processed["_id"]["$in"] == [
+        "5f50c31e8a91e73550a97d5f ", ObjectId("5f50c31e8a91e73550a97d60")
+    ]
+
+
+def test_sample_collections(mock_mongodb):
+    """Test sampling several collections with a single aggregation."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.aggregate.return_value = [
+        {"collection": "users", "document": {"_id": "5f50c31e8a91e73550a97d5f", "name": "John"}},
+        {"collection": "orders", "document": {"_id": 1, "total": 10}},
+    ]
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    samples = tool.sample_collections(["users", "products", "orders"])
+
+    # Assert
+    assert samples == {
+        "users": [{"_id": "5f50c31e8a91e73550a97d5f", "name": "John"}],
+        "products": [],
+        "orders": [{"_id": 1, "total": 10}],
+    }
+    pipeline = mock_collection.aggregate.call_args[0][0]
+    assert pipeline[0] == {"$limit": 1}
+    assert [stage["$unionWith"]["coll"] for stage in pipeline[2:]] == ["products", "orders"]
+    mock_collection.aggregate.assert_called_once()
+
+
+def test_client_options_forwarded(mock_mongodb):
+    """Test that client options are passed to MongoClient."""
+    mock_client, _, _ = mock_mongodb
+
+    MongoDBTool("mongodb://localhost:27017", "test_db", maxPoolSize=50)
+
+    mock_client.assert_called_once_with("mongodb://localhost:27017", maxPoolSize=50)
+
+
+def test_get_tool_is_shared(mock_mongodb):
+    """Test that the pool returns one tool per URI and database."""
+    get_tool.cache_clear()
+    try:
+        first = get_tool("mongodb://localhost:27017", "test_db")
+        second = get_tool("mongodb://localhost:27017", "test_db")
+        other = get_tool("mongodb://localhost:27017", "other_db")
+    finally:
+        get_tool.cache_clear()
+
+    assert first is second
+    assert other is not first
+
+
+def test_available_compressors():
+    """Test that only installed compressors are offered, with zlib as fallback."""
+    with mock.patch("importlib.util.find_spec", return_value=None):
+        assert _available_compressors() == "zlib"
+    with mock.patch("importlib.util.find_spec", return_value=object()):
+        assert _available_compressors() == "zstd,snappy,zlib"
+
+
+def test_iter_find(mock_mongodb):
+    """Test streaming documents from a cursor."""
+    _, _, mock_collection = mock_mongodb
+    mock_docs = [
+        {"_id": "5f50c31e8a91e73550a97d5f", "name": "John"},
+        {"_id": "5f50c31e8a91e73550a97d60", "name": "Jane"}
+    ]
+    mock_collection.find.return_value = iter(mock_docs)
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    docs = tool.iter_find("users", {"name": "J"})
+
+    # Assert
+    assert next(docs) == {"_id": "5f50c31e8a91e73550a97d5f", "name": "John"}
+    assert next(docs)["name"] == "Jane"
+    mock_collection.find.assert_called_once_with({"name": "J"}, None)
+
+
+def test_clients_are_shared(mock_mongodb):
+    """Test that tools with the same URI and options share a MongoClient."""
+    mock_client, _, _ = mock_mongodb
+    mock_client.side_effect = lambda *args, **kwargs: mock.MagicMock()
+
+    first = MongoDBTool("mongodb://localhost:27017", "test_db")
+    second = MongoDBTool("mongodb://localhost:27017", "other_db")
+    tuned = MongoDBTool("mongodb://localhost:27017", "test_db", maxPoolSize=50)
+
+    assert first.client is second.client
+    assert tuned.client is not first.client
+    assert mock_client.call_count == 2
+    mock_client.assert_called_with("mongodb://localhost:27017", maxPoolSize=50)
+
+    close_shared_clients()
+    first.client.close.assert_called_once_with()
+    tuned.client.close.assert_called_once_with()
+
+
+def test_clients_with_unhashable_options(mock_mongodb):
+    """Test that list and dict client options are accepted and still shared."""
+    mock_client, _, _ = mock_mongodb
+    options = {
+        "compressors": ["zlib"],
+        "authMechanismProperties": {"SERVICE_NAME": "mongodb"},
+    }
+
+    first = MongoDBTool("mongodb://localhost:27017", "test_db", **options)
+    second = MongoDBTool("mongodb://localhost:27017", "test_db", **options)
+
+    assert first.client is second.client
+    mock_client.assert_called_once_with("mongodb://localhost:27017", **options)
+
+
+def test_close_shared_clients_resets_pool(mock_mongodb):
+    """Test that closing the shared clients also drops the pooled tools."""
+    get_tool.cache_clear()
+    try:
+        first = get_tool("mongodb://localhost:27017", "test_db")
+        close_shared_clients()
+        second = get_tool("mongodb://localhost:27017", "test_db")
+    finally:
+        get_tool.cache_clear()
+
+    assert second is not first
+
+
+def test_bulk_write(mock_mongodb):
+    """Test building bulk write operations."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.bulk_write.return_value = mock.MagicMock(
+        inserted_count=1, modified_count=1, deleted_count=1, upserted_count=0
+    )
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    result = tool.bulk_write("users", [
+        {"type": "insert", "document": {"name": "Bob"}},
+        {"type": "update", "filter": {"name": "Bob"}, "update": {"$set": {"age": 30}}},
+        {"type": "delete", "filter": {"name": "Carol"}},
+    ])
+
+    # Assert
+    assert result == {
+        "inserted_count": 1, "modified_count": 1, "deleted_count": 1, "upserted_count": 0
+    }
+    ops = mock_collection.bulk_write.call_args[0][0]
+    assert ops == [
+        InsertOne({"name": "Bob"}),
+        UpdateOne({"name": "Bob"}, {"$set": {"age": 30}}),
+        DeleteOne({"name": "Carol"}),
+    ]
+    assert mock_collection.bulk_write.call_args.kwargs["ordered"] is True
+
+
+def test_bulk_write_many_operations(mock_mongodb):
+    """Test multi-document bulk operations and ObjectId filter conversion."""
+    _, _, mock_collection = mock_mongodb
+    oid = ObjectId("5f50c31e8a91e73550a97d5f")
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    tool.bulk_write("users", [
+        {"type": "update_many", "filter": {"active": False}, "update": {"$set": {"archived": True}}},
+        {"type": "delete_many", "filter": {"archived": True}},
+        {"type": "delete", "filter": {"_id": str(oid)}},
+    ])
+
+    # Assert
+    ops = mock_collection.bulk_write.call_args[0][0]
+    assert ops == [
+        UpdateMany({"active": False}, {"$set": {"archived": True}}),
+        DeleteMany({"archived": True}),
+        DeleteOne({"_id": oid}),
+    ]
+
+
+def test_bulk_write_insert_only_is_unordered(mock_mongodb):
+    """Test that insert-only batches are sent unordered."""
+    _, _, mock_collection = mock_mongodb
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    tool.bulk_write("users", [{"type": "insert", "document": {"name": "Bob"}}])
+
+    # Assert
+    assert mock_collection.bulk_write.call_args.kwargs["ordered"] is False
+
+    with pytest.raises(ValueError):
+        tool.bulk_write("users", [{"type": "upsert", "document": {}}])
+
+
+def test_collection_handles_are_cached(mock_mongodb):
+    """Test that collection handles are looked up once per name."""
+    _, mock_db, mock_collection = mock_mongodb
+    mock_collection.count_documents.return_value = 1
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call methods
+    tool.count_documents("users", {"active": True})
+    tool.count_documents("users", {"active": False})
+    tool.list_indexes("users")
+
+    # Assert
+    mock_db.__getitem__.assert_called_once_with("users")
+
+
+def test_run_command(mock_mongodb):
+    """Test serializing BSON values in command results."""
+    _, mock_db, _ = mock_mongodb
+    oid = ObjectId("5f50c31e8a91e73550a97d5f")
+    mock_db.command.return_value = {
+        "ok": 1.0,
+        "operationTime": datetime(2024, 1, 2, 3, 4, 5),
+        "cursor": {"firstBatch": [{"_id": oid, "data": b"\x01\xff", "tags": [oid]}]},
+    }
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    result = tool.run_command({"find": "users"})
+
+    # Assert
+    assert result == {
+        "ok": 1.0,
+        "operationTime": "2024-01-02T03:04:05",
+        "cursor": {
+            "firstBatch": [
+                {"_id": str(oid), "data": "01ff", "tags": [str(oid)]}
+            ]
+        },
+    }
+    mock_db.command.assert_called_once_with({"find": "users"})
+
+
+def test_object_ids_decoded_as_strings():
+    """Test that documents are read with ObjectIds decoded to strings."""
+    close_shared_clients()
+    try:
+        tool = MongoDBTool(
+            "mongodb://localhost:27017/?uuidRepresentation=standard&tz_aware=true",
+            "test_db",
+            connect=False,
+        )
+        codec_options = tool.db.codec_options
+    finally:
+        close_shared_clients()
+
+    # URI codec settings are kept alongside the ObjectId decoder
+    assert codec_options.type_registry is DOCUMENT_TYPE_REGISTRY
+    assert codec_options.uuid_representation == UuidRepresentation.STANDARD
+    assert codec_options.tz_aware is True
+
+    oid = ObjectId("5f50c31e8a91e73550a97d5f")
+    when = datetime(2024, 1, 2, tzinfo=timezone.utc)
+    data = bson.encode({"_id": oid, "items": [{"ref": oid}], "when": when})
+    assert bson.decode(data, codec_options=codec_options) == {
+        "_id": str(oid),
+        "items": [{"ref": str(oid)}],
+        "when": when,
+    }
+
+
+def test_projection_pushdown(mock_mongodb):
+    """Test that projections are sent to the server."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.find.return_value.limit.return_value.batch_size.return_value = [
+        {"name": "John"}
+    ]
+    mock_collection.aggregate.return_value = [{"name": "John"}]
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call methods
+    docs = tool.find_documents("users", {}, limit=5, projection={"_id": 0, "name": 1})
+    tool.aggregate_documents("users", [{"$match": {}}], projection={"name": 1})
+
+    # Assert
+    assert docs == [{"name": "John"}]
+    mock_collection.find.assert_called_once_with({}, {"_id": 0, "name": 1})
+    mock_collection.aggregate.assert_called_once_with(
+        [{"$match": {}}, {"$project": {"name": 1}}]
+    )
+
+
+def test_count_documents(mock_mongodb):
+    """Test counting documents with and without a filter."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.count_documents.return_value = 3
+    mock_collection.estimated_document_count.return_value = 10
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method and assert
+    assert tool.count_documents("users", {"active": True}) == 3
+    assert tool.count_documents("users", {}) == 10
+    mock_collection.count_documents.assert_called_once_with({"active": True})
+    mock_collection.estimated_document_count.assert_called_once_with()
+
+
+def test_metadata_cache(mock_mongodb):
+    """Test that metadata lookups are cached and invalidated by writes."""
+    _, mock_db, mock_collection = mock_mongodb
+    mock_collection.list_indexes.return_value = iter([{"name": "_id_"}])
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Repeated lookups hit the server once
+    assert tool.list_collections() == ["users", "products"]
+    assert tool.list_collections() == ["users", "products"]
+    assert tool.list_indexes("users") == [{"name": "_id_"}]
+    assert tool.list_indexes("users") == [{"name": "_id_"}]
+    mock_db.list_collection_names.assert_called_once()
+    mock_collection.list_indexes.assert_called_once()
+
+    # Index changes drop the cached entries
+    mock_collection.list_indexes.return_value = iter([{"name": "_id_"}, {"name": "age_1"}])
+    tool.create_index("users", {"age": 1})
+    assert len(tool.list_indexes("users")) == 2
+    tool.list_collections()
+    assert mock_db.list_collection_names.call_count == 2
+
+    # Expired entries are reloaded
+    with mock.patch("mongo_llm_cli.mongodb_tool.METADATA_CACHE_TTL", 0):
+        tool.list_collections()
+    assert mock_db.list_collection_names.call_count == 3
+
+
+def test_aggregate_out_invalidates_metadata(mock_mongodb):
+    """Test that pipelines writing a collection drop the cached metadata."""
+    _, mock_db, mock_collection = mock_mongodb
+    mock_db.list_collection_names.return_value = ["users"]
+    mock_collection.aggregate.return_value = []
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+    tool.list_collections()
+
+    # Call method
+    tool.aggregate_documents("users", [{"$match": {"age": 30}}])
+    tool.list_collections()
+    tool.aggregate_documents("users", [{"$out": "adults"}])
+    tool.list_collections()
+
+    # Assert
+    assert mock_db.list_collection_names.call_count == 2
+
+
+def test_aggregate_hoists_match(mock_mongodb):
+    """Test that $match stages are moved ahead of stages they commute with."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.aggregate.return_value = []
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    tool.aggregate_documents(
+        "users",
+        [
+            {"$sort": {"age": 1}},
+            {"$set": {"label": "x"}},
+            {"$match": {"status": "active"}},
+            {"$set": {"status": "done"}},
+            {"$match": {"status": "done"}},
+            {"$match": {"$expr": {"$gt": ["$a", "$b"]}}},
+        ],
+        hint="status_1",
+        max_time_ms=500,
+    )
+
+    # Assert
+    mock_collection.aggregate.assert_called_once_with(
+        [
+            {"$match": {"status": "active"}},
+            {"$sort": {"age": 1}},
+            {"$set": {"label": "x"}},
+            {"$set": {"status": "done"}},
+            {"$match": {"status": "done"}},
+            {"$match": {"$expr": {"$gt": ["$a", "$b"]}}},
+        ],
+        hint="status_1",
+        maxTimeMS=500,
+    )
+
+
+def test_distinct_values_limit(mock_mongodb):
+    """Test fetching a limited number of distinct values through a cursor."""
+    _, _, mock_collection = mock_mongodb
+    mock_collection.aggregate.return_value = iter([{"_id": "NY"}, {"_id": "LA"}])
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    values = tool.distinct_values("users", "tags.name", {"active": True}, limit=2, stream=True)
+
+    # Assert
+    assert list(values) == ["NY", "LA"]
+    mock_collection.distinct.assert_not_called()
+    pipeline = mock_collection.aggregate.call_args[0][0]
+    assert pipeline[0] == {
+        "$match": {"$and": [{"active": True}, {"tags.name": {"$exists": True}}]}
+    }
+    assert pipeline[1] == {
+        "$project": {"_id": 0, "value": _distinct_expression("tags.name")}
+    }
+    assert pipeline[2:] == [
+        {"$unwind": "$value"},
+        {"$group": {"_id": "$value"}},
+        {"$limit": 2},
+    ]
+    assert mock_collection.aggregate.call_args[1] == {"allowDiskUse": True}
+
+
+def test_distinct_expression_walks_each_segment():
+    """Test that every segment of a dotted path traverses arrays."""
+    expression = _distinct_expression("a.b")
+
+    # The outer reduce unwinds arrays found at the end of the path
+    leaf = expression["$reduce"]["input"]["$map"]
+    assert leaf["in"] == "$$this.b"
+    # Arrays of subdocuments are traversed before reading "b"
+    parent = leaf["input"]["$filter"]["input"]["$reduce"]["input"]["$map"]
+    assert parent["in"] == "$$this.a"
+    assert parent["input"]["$filter"]["input"]["$reduce"]["input"] == ["$$ROOT"]
+
+
+def test_insert_many_documents_partial_failure(mock_mongodb):
+    """Test that successful inserts are reported when some documents fail."""
+    _, _, mock_collection = mock_mongodb
+    docs = [
+        {"_id": ObjectId("5f50c31e8a91e73550a97d5f")},
+        {"_id": ObjectId("5f50c31e8a91e73550a97d60")},
+    ]
+    mock_collection.insert_many.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 0, "code": 11000, "errmsg": "E11000 duplicate key"}]}
+    )
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    with pytest.raises(PartialInsertError) as excinfo:
+        tool.insert_many_documents("users", docs)
+
+    # Assert
+    assert excinfo.value.inserted_ids == ["5f50c31e8a91e73550a97d60"]
+    assert "Inserted 1 of 2 documents, 1 failed" in str(excinfo.value)
+    assert "document 0: E11000 duplicate key" in str(excinfo.value)
+    assert "5f50c31e8a91e73550a97d60" in str(excinfo.value)
+    mock_collection.insert_many.assert_called_once_with(docs, ordered=False)
+
+
+def test_describe_database(mock_mongodb):
+    """Test describing all collections with a single aggregation."""
+    _, mock_db, mock_collection = mock_mongodb
+    mock_db.list_collections.return_value = [
+        {"name": "users", "type": "collection", "options": {}},
+        {"name": "active_users", "type": "view", "options": {"viewOn": "users"}},
+    ]
+    mock_collection.aggregate.return_value = [
+        {"collection": "users", "index": {"name": "_id_", "key": {"_id": 1}}},
+        {"collection": "users", "stats": {"count": 2, "size": 100}},
+    ]
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    description = tool.describe_database()
+
+    # Assert
+    assert description["users"]["indexes"] == [{"name": "_id_", "key": {"_id": 1}}]
+    assert description["users"]["stats"] == {"count": 2, "size": 100}
+    assert description["active_users"]["indexes"] == []
+    pipeline = mock_collection.aggregate.call_args[0][0]
+    assert pipeline[0] == {"$indexStats": {}}
+    mock_collection.aggregate.assert_called_once()
+
+
+def test_describe_database_sharded(mock_mongodb):
+    """Test merging the per-shard results of a sharded collection."""
+    _, mock_db, mock_collection = mock_mongodb
+    mock_db.list_collections.return_value = [{"name": "users", "type": "collection"}]
+    index = {"name": "_id_", "key": {"_id": 1}}
+    mock_collection.aggregate.return_value = [
+        {"collection": "users", "index": index},
+        {"collection": "users", "index": index},
+        {
+            "collection": "users",
+            "stats": {
+                "count": 2,
+                "size": 100,
+                "avgObjSize": 50,
+                "storageSize": 4096,
+                "totalIndexSize": 4096,
+            },
+        },
+        {
+            "collection": "users",
+            "stats": {
+                "count": 3,
+                "size": 200,
+                "avgObjSize": 66,
+                "storageSize": 8192,
+                "totalIndexSize": 4096,
+            },
+        },
+    ]
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    description = tool.describe_database()
+
+    # Assert
+    assert description["users"]["indexes"] == [index]
+    assert description["users"]["stats"] == {
+        "count": 5,
+        "size": 300,
+        "avgObjSize": 60,
+        "storageSize": 12288,
+        "totalIndexSize": 8192,
+    }
+
+
+def test_describe_database_fallback(mock_mongodb):
+    """Test describing collections one by one when the aggregation fails."""
+    _, mock_db, mock_collection = mock_mongodb
+    mock_db.list_collections.return_value = [{"name": "users", "type": "collection"}]
+    mock_collection.aggregate.side_effect = OperationFailure("$indexStats not allowed")
+    mock_collection.list_indexes.return_value = iter(
+        [{"v": 2, "name": "_id_", "key": {"_id": 1}}]
+    )
+    mock_db.command.return_value = {"ns": "test_db.users", "count": 2, "size": 100}
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    description = tool.describe_database()
+
+    # Assert
+    assert description["users"]["indexes"] == [{"name": "_id_", "key": {"_id": 1}}]
+    assert description["users"]["stats"]["count"] == 2
+    assert "ns" not in description["users"]["stats"]
+    mock_db.command.assert_called_once_with("collstats", "users")
+
+
+def test_update_one_document_return_doc(mock_mongodb):
+    """Test returning the updated document without a second round trip."""
+    _, _, mock_collection = mock_mongodb
+    oid = ObjectId("5f50c31e8a91e73550a97d5f")
+    mock_collection.find_one_and_update.return_value = {"_id": str(oid), "age": 31}
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method
+    result = tool.update_one_document(
+        "users",
+        {"_id": str(oid)},
+        {"$inc": {"age": 1}},
+        return_doc="after",
+        projection={"age": 1},
+    )
+
+    # Assert
+    assert result == {"document": {"_id": str(oid), "age": 31}}
+    mock_collection.update_one.assert_not_called()
+    args, kwargs = mock_collection.find_one_and_update.call_args
+    assert args == ({"_id": oid}, {"$inc": {"age": 1}})
+    assert kwargs["projection"] == {"age": 1}
+    assert kwargs["return_document"] == ReturnDocument.AFTER
+
+
+def test_insert_documents_batch(mock_mongodb):
+    """Test that lists of documents are inserted with one insert_many call."""
+    _, _, mock_collection = mock_mongodb
+    oids = [ObjectId("5f50c31e8a91e73550a97d5f"), ObjectId("5f50c31e8a91e73550a97d60")]
+    mock_collection.insert_many.return_value.inserted_ids = oids
+    unacknowledged = mock_collection.with_options.return_value
+    unacknowledged.insert_many.return_value.inserted_ids = oids
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+    docs = [{"name": "John"}, {"name": "Jane"}]
+
+    # Call methods and assert
+    assert tool.insert_document("users", docs) == [str(oid) for oid in oids]
+    mock_collection.insert_one.assert_not_called()
+    mock_collection.insert_many.assert_called_once_with(docs, ordered=False)
+
+    assert tool.insert_many_documents("users", docs, fast=True) == [str(oid) for oid in oids]
+    write_concern = mock_collection.with_options.call_args.kwargs["write_concern"]
+    assert write_concern.document == {"w": 0}
+    unacknowledged.insert_many.assert_called_once_with(docs, ordered=False)
+
+
+def test_list_indexes_many(mock_mongodb):
+    """Test listing the indexes of several collections."""
+    _, mock_db, _ = mock_mongodb
+    collections = {
+        "users": mock.MagicMock(spec=Collection),
+        "orders": mock.MagicMock(spec=Collection),
+    }
+    collections["users"].list_indexes.return_value = iter([{"name": "_id_"}])
+    collections["orders"].list_indexes.return_value = iter([{"name": "_id_"}, {"name": "total_1"}])
+    mock_db.__getitem__.side_effect = collections.__getitem__
+
+    # Create tool instance
+    tool = MongoDBTool("mongodb://localhost:27017", "test_db")
+
+    # Call method and assert
+    assert tool.list_indexes_many(["users", "orders"]) == {
+        "users": [{"name": "_id_"}],
+        "orders": [{"name": "_id_"}, {"name": "total_1"}],
+    }
+    assert tool.list_indexes_many([]) == {}
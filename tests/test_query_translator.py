@@ -0,0 +1,29 @@
+"""Tests for the query translator."""
+
+import pytest
+
+from mongo_llm_cli.query_translator import ParsedQuery, translate
+
+
+def test_translate():
+    """Test translating a valid LLM response."""
+    parsed = translate({"tool": "list_collections", "args": {}})
+
+    assert parsed == ParsedQuery(tool="list_collections", args={})
+
+
+@pytest.mark.parametrize(
+    "response, message",
+    [
+        ({"args": {}}, "Missing 'tool' field in LLM response"),
+        ({}, "Missing 'args', 'tool' fields in LLM response"),
+        ({"tool": "find_documents", "args": []}, "Expected 'args' to be a dictionary"),
+        (["find_documents"], "Expected a dictionary response"),
+    ],
+)
+def test_translate_invalid(response, message):
+    """Test that invalid LLM responses raise a ValueError."""
+    with pytest.raises(ValueError) as excinfo:
+        translate(response)
+
+    assert message in str(excinfo.value)
@@ -0,0 +1,113 @@
+"""Tests for the schema inspector."""
+
+import stat
+from unittest import mock
+
+import pytest
+
+from mongo_llm_cli.schema_inspector import (
+    _cache_path,
+    clear_schema_cache,
+    inspect_schema,
+)
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path, monkeypatch):
+    """Point the schema cache at a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def mock_tool():
+    """Mock MongoDB tool with two collections."""
+    tool = mock.MagicMock()
+    tool.uri = "mongodb://localhost:27017"
+    tool.db_name = "test_db"
+    tool.list_collections.return_value = ["users", "products"]
+    tool.sample_collections.return_value = {
+        "users": [{"_id": "1", "name": "John"}],
+        "products": [],
+    }
+    return tool
+
+
+def test_inspect_schema(mock_tool):
+    """Test collecting collections and sample documents."""
+    schema = inspect_schema(mock_tool)
+
+    assert schema["collections"] == ["users", "products"]
+    assert schema["sample_documents"]["users"] == {"_id": "1", "name": "John"}
+    assert schema["sample_documents"]["products"] == {}
+    mock_tool.sample_collections.assert_called_once_with(["users", "products"], limit=1)
+    mock_tool.find_documents.assert_not_called()
+
+
+def test_inspect_schema_uses_cache(mock_tool):
+    """Test that a cached schema is reused until refreshed."""
+    first = inspect_schema(mock_tool)
+    second = inspect_schema(mock_tool)
+
+    assert second == first
+    mock_tool.list_collections.assert_called_once()
+
+    inspect_schema(mock_tool, refresh=True)
+    assert mock_tool.list_collections.call_count == 2
+
+
+def test_inspect_schema_cache_disabled(mock_tool, cache_home):
+    """Test that a TTL of zero bypasses the cache."""
+    inspect_schema(mock_tool, ttl=0)
+    inspect_schema(mock_tool, ttl=0)
+
+    assert mock_tool.list_collections.call_count == 2
+    assert not (cache_home / "mongo_llm_cli").exists()
+
+
+def test_inspect_schema_cache_permissions(mock_tool, cache_home):
+    """Test that the schema cache is only readable by its owner."""
+    inspect_schema(mock_tool)
+
+    cache_dir = cache_home / "mongo_llm_cli"
+    (cache_file,) = cache_dir.glob("schema-*.json")
+    assert stat.S_IMODE(cache_dir.stat().st_mode) == 0o700
+    assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+
+
+def test_clear_schema_cache(mock_tool, cache_home):
+    """Test that clearing the cache forces the next inspection to reload."""
+    inspect_schema(mock_tool)
+    clear_schema_cache(mock_tool)
+    clear_schema_cache(mock_tool)
+    inspect_schema(mock_tool)
+
+    assert mock_tool.list_collections.call_count == 2
+    assert not list((cache_home / "mongo_llm_cli").glob("*.tmp"))
+
+
+def test_cache_path_separates_uri_and_database():
+    """Test that the URI and database name cannot run together in the key."""
+    first = mock.MagicMock(uri="mongodb://host/a", db_name="b")
+    second = mock.MagicMock(uri="mongodb://host/", db_name="ab")
+
+    assert _cache_path(first) != _cache_path(second)
+
+
+def test_inspect_schema_sample_error(mock_tool):
+    """Test that a failing sample fetch is recorded per collection."""
+    mock_tool.sample_collections.side_effect = Exception("$unionWith not supported")
+
+    def find_documents(collection, filter, limit):
+        if collection == "products":
+            raise Exception("not authorized")
+        return [{"_id": "1"}]
+
+    mock_tool.find_documents.side_effect = find_documents
+
+    schema = inspect_schema(mock_tool, ttl=0)
+
+    assert list(schema["sample_documents"]) == ["users", "products"]
+    assert schema["sample_documents"]["users"] == {"_id": "1"}
+    assert schema["sample_documents"]["products"] == {"error": "not authorized"}
+    assert mock_tool.find_documents.call_count == 2